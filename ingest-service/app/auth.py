@@ -1,25 +1,30 @@
 """
 JWT Authentication module.
 """
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+import anyio
+import bcrypt
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from passlib.context import CryptContext
 
 from app.config import settings
 from app.logger import get_logger
 from app.exceptions import ValidationError
+from app.constants import Role
 
 logger = get_logger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Modular crypt format of a bcrypt hash: "$2b$" + cost + "$" + 53 chars
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_HASH_LENGTH = 60
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -32,7 +37,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    # Reject anything that is not a well-formed bcrypt hash before paying
+    # for the key derivation
+    if len(hashed_password) != _BCRYPT_HASH_LENGTH or not hashed_password.startswith(
+        _BCRYPT_PREFIXES
+    ):
+        return False
+    
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"),
+            hashed_password.encode("utf-8"),
+        )
+    except ValueError:
+        # Malformed hash
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -45,7 +64,25 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password in a worker thread without blocking the event loop.
+    
+    bcrypt releases the GIL while hashing, so concurrent verifications run
+    in parallel across the threadpool.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await anyio.to_thread.run_sync(verify_password, plain_password, hashed_password)
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -105,10 +142,29 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+@lru_cache(maxsize=settings.JWT_DECODE_CACHE_SIZE)
+def _decode_verified(token: str, secret_key: str, algorithm: str) -> Dict[str, Any]:
+    """
+    Verify a JWT and return its claims, memoized per token.
+    
+    Invalid tokens raise and are therefore never cached. The signing key and
+    algorithm are part of the key so rotating them invalidates old entries.
+    """
+    return jwt.decode(
+        token,
+        secret_key,
+        algorithms=[algorithm],
+        options={"require": ["exp", "iat"]},
+    )
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and verify a JWT token.
     
+    Verified payloads are cached by token string; expiry is re-checked on
+    every call so a cached token stops being accepted once it expires.
+    
     Args:
         token: JWT token string
         
@@ -119,19 +175,31 @@ def decode_token(token: str) -> Dict[str, Any]:
         HTTPException: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
+        payload = _decode_verified(
+            token, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM
         )
-        return payload
-    except JWTError as e:
+    except jwt.InvalidTokenError as e:
         logger.warning(f"JWT decode error: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
+    
+    if payload["exp"] <= time.time():
+        logger.warning("JWT decode error: Signature has expired")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # Callers get their own copy, including list claims such as roles, so
+    # the cached claims cannot be mutated
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in payload.items()
+    }
 
 
 def get_current_user(
@@ -155,17 +223,10 @@ def get_current_user(
     if token.startswith(settings.JWT_TOKEN_PREFIX + " "):
         token = token[len(settings.JWT_TOKEN_PREFIX) + 1:]
     
+    # Served from the verified-token cache after the first request; expiry
+    # is re-checked there on every call
     payload = decode_token(token)
     
-    # Check if token is expired (jwt.decode already does this, but double-check)
-    exp = payload.get("exp")
-    if exp and datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(timezone.utc):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token expired",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
     # Extract user information
     user_id: Optional[str] = payload.get("sub")
     if user_id is None:
@@ -224,7 +285,7 @@ def create_test_token(user_id: str = "test-user", username: str = "testuser") ->
         "sub": user_id,
         "username": username,
         "email": f"{username}@test.com",
-        "roles": ["user"],
+        "roles": Role.USER.to_names(),
         "permissions": [],
     }
     return create_access_token(data)
@@ -0,0 +1,46 @@
+"""
+Small in-process caching helpers.
+"""
+import threading
+import time
+from functools import wraps
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def ttl_cache(ttl_seconds: float) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Cache the result of a zero-argument function for a fixed time.
+    
+    Concurrent callers wait on a lock while the value is refreshed, so a
+    burst of calls results in a single underlying call. The wrapped function
+    exposes ``cache_clear()`` like ``functools.lru_cache``.
+    
+    Args:
+        ttl_seconds: How long a result stays valid; 0 disables caching
+    
+    Returns:
+        Decorator for the function to cache
+    """
+    def decorator(func: Callable[[], T]) -> Callable[[], T]:
+        lock = threading.Lock()
+        entry: list = []  # [expires_at, value] once populated
+        
+        @wraps(func)
+        def wrapper() -> T:
+            with lock:
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+                value = func()
+                entry[:] = [time.monotonic() + ttl_seconds, value]
+                return value
+        
+        def cache_clear() -> None:
+            with lock:
+                entry.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
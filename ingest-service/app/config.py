@@ -75,6 +75,14 @@ class Settings(BaseSettings):
         default=1800,
         description="Presigned URL expiration time in seconds"
     )
+    S3_MAX_POOL_CONNECTIONS: int = Field(
+        default=64,
+        description="Maximum pooled HTTP connections held by the S3 client"
+    )
+    S3_ADDRESSING_STYLE: str = Field(
+        default="path",
+        description="S3 addressing style (path/virtual/auto); MinIO requires path"
+    )
     
     # Job Configuration
     MAX_RETRY_COUNT: int = Field(default=3, description="Maximum job retry count")
@@ -116,6 +124,16 @@ class Settings(BaseSettings):
         default="Bearer",
         description="JWT token prefix in Authorization header"
     )
+    JWT_DECODE_CACHE_SIZE: int = Field(
+        default=4096,
+        description="Maximum number of verified token payloads kept in memory"
+    )
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor (log2 rounds) for password hashing"
+    )
     
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = Field(
@@ -145,6 +163,13 @@ class Settings(BaseSettings):
         description="Enable request timeout"
     )
     
+    # Health Checks
+    HEALTH_CHECK_CACHE_TTL_SECONDS: float = Field(
+        default=1.0,
+        ge=0,
+        description="How long dependency health check results are reused"
+    )
+    
     @field_validator("DATABASE_URL")
     @classmethod
     def validate_database_url(cls, v: str) -> str:
@@ -1,7 +1,7 @@
 """
 Application constants.
 """
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class JobStatus(str, Enum):
@@ -34,6 +34,27 @@ class StorageType(str, Enum):
     LOCAL = "local"
 
 
+class _NamedFlag(IntFlag):
+    """Bitmask enumeration that renders as lowercase member names."""
+
+    def to_names(self) -> list[str]:
+        """Materialize the mask as a list of lowercase member names."""
+        return [member.name.lower() for member in type(self) if member & self]
+
+
+class Role(_NamedFlag):
+    """User role bitmask; bit order is the order names appear in token claims."""
+    ADMIN = 1 << 0
+    USER = 1 << 1
+
+
+class Permission(_NamedFlag):
+    """User permission bitmask."""
+    READ = 1 << 0
+    WRITE = 1 << 1
+    ADMIN = 1 << 2
+
+
 # Error messages
 ERROR_JOB_NOT_FOUND = "Job not found"
 ERROR_INVALID_JOB_STATE = "Invalid job state"
@@ -3,13 +3,14 @@ Database configuration and session management.
 """
 from contextlib import contextmanager
 from typing import Generator
-from sqlalchemy import create_engine, event, pool, text
+from sqlalchemy import create_engine, event, pool
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from app.config import settings
+from app.cache import ttl_cache
 from app.logger import get_logger
 from app.exceptions import DatabaseError
 
@@ -100,13 +101,14 @@ def init_db() -> None:
         raise
 
 
+@ttl_cache(settings.HEALTH_CHECK_CACHE_TTL_SECONDS)
 def check_db_connection() -> bool:
     """Check if database connection is healthy."""
     try:
+        # Reuses a pooled connection; the read-only probe needs no commit, the
+        # implicit rollback on return to the pool is enough
         with engine.connect() as conn:
-            # SQLAlchemy 2.0 requires text() wrapper for raw SQL
-            conn.execute(text("SELECT 1"))
-            conn.commit()
+            conn.exec_driver_sql("SELECT 1")
         return True
     except Exception as e:
         logger.error(f"Database connection check failed: {e}")
@@ -39,22 +39,23 @@ class ValidationError(IngestServiceException):
     pass
 
 
+# Built once at import rather than on every conversion
+_EXCEPTION_HTTP_MAP = {
+    JobNotFoundError: (status.HTTP_404_NOT_FOUND, "Job not found"),
+    InvalidJobStateError: (status.HTTP_400_BAD_REQUEST, "Invalid job state"),
+    StorageError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Storage service unavailable"),
+    DatabaseError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Database service unavailable"),
+    QueueError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Queue service unavailable"),
+    ValidationError: (status.HTTP_422_UNPROCESSABLE_ENTITY, "Validation error"),
+}
+_DEFAULT_HTTP_ERROR = (status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error")
+
+
 def handle_service_exception(exception: IngestServiceException) -> HTTPException:
     """Convert service exceptions to HTTP exceptions."""
-    exception_map = {
-        JobNotFoundError: (status.HTTP_404_NOT_FOUND, "Job not found"),
-        InvalidJobStateError: (status.HTTP_400_BAD_REQUEST, "Invalid job state"),
-        StorageError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Storage service unavailable"),
-        DatabaseError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Database service unavailable"),
-        QueueError: (status.HTTP_503_SERVICE_UNAVAILABLE, "Queue service unavailable"),
-        ValidationError: (status.HTTP_422_UNPROCESSABLE_ENTITY, "Validation error"),
-    }
-    
-    status_code, default_message = exception_map.get(
-        type(exception),
-        (status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error")
+    status_code, default_message = _EXCEPTION_HTTP_MAP.get(
+        type(exception), _DEFAULT_HTTP_ERROR
     )
     
-    message = str(exception) if str(exception) else default_message
+    message = str(exception) or default_message
     return HTTPException(status_code=status_code, detail=message)
-
@@ -2,9 +2,16 @@
 Main FastAPI application for the ingest service.
 """
 from contextlib import asynccontextmanager
+from functools import lru_cache
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import time
@@ -55,9 +62,11 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Log ingestion service for uploading and processing log files",
-    docs_url="/docs" if not settings.is_production else None,
-    redoc_url="/redoc" if not settings.is_production else None,
-    openapi_url="/openapi.json" if not settings.is_production else None,
+    # Docs routes are registered below so the schema is served from a cache
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -216,3 +225,45 @@ async def root():
         "status": "running",
         "environment": settings.ENVIRONMENT,
     }
+
+
+@lru_cache(maxsize=1)
+def _openapi_json() -> bytes:
+    """Serialize the OpenAPI schema once; routes are fixed after startup."""
+    return orjson.dumps(app.openapi())
+
+
+if not settings.is_production:
+    @app.get("/openapi.json", include_in_schema=False)
+    async def openapi_json() -> Response:
+        """OpenAPI schema, served from pre-serialized bytes."""
+        return Response(content=_openapi_json(), media_type="application/json")
+    
+    def _root_path(request: Request) -> str:
+        """Mount prefix set by a path-prefixed proxy, as FastAPI's own docs use."""
+        return request.scope.get("root_path", "").rstrip("/")
+    
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_ui_html(request: Request):
+        """Swagger UI."""
+        root_path = _root_path(request)
+        return get_swagger_ui_html(
+            openapi_url=root_path + "/openapi.json",
+            title=f"{app.title} - Swagger UI",
+            oauth2_redirect_url=root_path + app.swagger_ui_oauth2_redirect_url,
+            init_oauth=app.swagger_ui_init_oauth,
+            swagger_ui_parameters=app.swagger_ui_parameters,
+        )
+    
+    @app.get(app.swagger_ui_oauth2_redirect_url, include_in_schema=False)
+    async def swagger_ui_redirect():
+        """Swagger UI OAuth2 redirect target for the Authorize flow."""
+        return get_swagger_ui_oauth2_redirect_html()
+    
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc_html(request: Request):
+        """ReDoc documentation."""
+        return get_redoc_html(
+            openapi_url=_root_path(request) + "/openapi.json",
+            title=f"{app.title} - ReDoc",
+        )
@@ -1,6 +1,8 @@
 """
 Database models for the ingest service.
 """
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from sqlalchemy import Column, String, Integer, TIMESTAMP, Text, ForeignKey, Index
@@ -11,6 +13,35 @@ from app.database import Base
 from app.constants import JobStatus, JobType, StorageType, LogFormat
 
 
+def generate_uuid7() -> str:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are a millisecond Unix timestamp, so new keys are
+    appended to the right of the primary key index instead of splitting
+    random B-tree leaves.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= ((rand >> 62) & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFFFFFFFFFFFFFF  # rand_b
+    return str(uuid.UUID(int=value))
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time, used as a client-side column default.
+    
+    Setting timestamps in Python means the ORM already knows their values
+    after INSERT/UPDATE and never has to fetch them back from the database.
+    The server defaults remain for rows written outside the ORM.
+    """
+    return datetime.now(timezone.utc)
+
+
 class Job(Base):
     """Job model for tracking ingestion jobs."""
     
@@ -20,7 +51,7 @@ class Job(Base):
         Index("idx_job_created_at", "created_at"),
     )
 
-    job_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    job_id = Column(String, primary_key=True, default=generate_uuid7)
     job_type = Column(String, nullable=False, index=True)
     source = Column(String, nullable=False)
     status = Column(String, nullable=False, default=JobStatus.CREATED.value, index=True)
@@ -29,6 +60,7 @@ class Job(Base):
 
     created_at = Column(
         TIMESTAMP(timezone=True),
+        default=utcnow,
         server_default=func.now(),
         nullable=False,
     )
@@ -37,8 +69,9 @@ class Job(Base):
     finished_at = Column(TIMESTAMP(timezone=True))
     updated_at = Column(
         TIMESTAMP(timezone=True),
+        default=utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow,
         nullable=False,
     )
 
@@ -69,6 +102,7 @@ class FileUpload(Base):
     
     created_at = Column(
         TIMESTAMP(timezone=True),
+        default=utcnow,
         server_default=func.now(),
         nullable=False,
     )
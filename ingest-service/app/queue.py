@@ -1,12 +1,14 @@
 """
 Redis queue management for job processing.
 """
-import json
+import threading
+import orjson
 import redis
-from typing import Optional
+from typing import List, Optional
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 
 from app.config import settings
+from app.cache import ttl_cache
 from app.logger import get_logger
 from app.exceptions import QueueError
 
@@ -14,35 +16,55 @@ logger = get_logger(__name__)
 
 # Create Redis client with connection pooling and retry logic
 redis_client: Optional[redis.Redis] = None
+_redis_client_lock = threading.Lock()
+
+
+def _create_redis_client() -> redis.Redis:
+    """Create a Redis client with the configured connection pool settings."""
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        decode_responses=False,  # Keep binary for JSON
+        retry_on_timeout=True,
+        health_check_interval=30,
+    )
 
 
 def get_redis_client() -> redis.Redis:
     """Get or create Redis client with proper configuration."""
     global redis_client
     
-    if redis_client is None:
-        try:
-            redis_client = redis.Redis.from_url(
-                settings.REDIS_URL,
-                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
-                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
-                decode_responses=False,  # Keep binary for JSON
-                retry_on_timeout=True,
-                health_check_interval=30,
-            )
-            # Test connection
-            redis_client.ping()
-            logger.info("Redis client initialized successfully")
-        except RedisConnectionError as e:
-            logger.error(f"Failed to connect to Redis: {e}")
-            raise QueueError(f"Redis connection failed: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error initializing Redis: {e}")
-            raise QueueError(f"Redis initialization failed: {str(e)}") from e
+    client = redis_client
+    if client is not None:
+        return client
+    
+    # Serialize first-time initialization so concurrent request threads
+    # share one client (and one connection pool) instead of racing to build several
+    with _redis_client_lock:
+        if redis_client is None:
+            try:
+                client = _create_redis_client()
+                # Test connection
+                client.ping()
+                redis_client = client
+                logger.info("Redis client initialized successfully")
+            except RedisConnectionError as e:
+                logger.error(f"Failed to connect to Redis: {e}")
+                raise QueueError(f"Redis connection failed: {str(e)}") from e
+            except Exception as e:
+                logger.error(f"Unexpected error initializing Redis: {e}")
+                raise QueueError(f"Redis initialization failed: {str(e)}") from e
     
     return redis_client
 
 
+def _encode_message(message: dict) -> dict:
+    """Build the stream entry fields for a job message."""
+    # orjson produces UTF-8 bytes directly, which is what redis-py sends anyway
+    return {"data": orjson.dumps(message)}
+
+
 def enqueue_job(message: dict) -> str:
     """
     Enqueue a job to Redis stream.
@@ -60,7 +82,7 @@ def enqueue_job(message: dict) -> str:
         client = get_redis_client()
         message_id = client.xadd(
             settings.REDIS_STREAM_KEY,
-            {"data": json.dumps(message)},
+            _encode_message(message),
             maxlen=10000,  # Keep last 10000 messages
         )
         logger.info(f"Job enqueued successfully: message_id={message_id}, job_id={message.get('job_id')}")
@@ -73,6 +95,47 @@ def enqueue_job(message: dict) -> str:
         raise QueueError(f"Unexpected error enqueueing job: {str(e)}") from e
 
 
+def enqueue_jobs(messages: List[dict]) -> List[str]:
+    """
+    Enqueue several jobs to the Redis stream in one round trip.
+    
+    The XADD commands are sent through a non-transactional pipeline, so the
+    batch is not atomic: if Redis fails mid-way some messages may already
+    be in the stream.
+    
+    Args:
+        messages: Job message dictionaries
+        
+    Returns:
+        Message IDs from Redis stream, in the same order as messages
+        
+    Raises:
+        QueueError: If enqueue operation fails
+    """
+    if not messages:
+        return []
+    
+    try:
+        client = get_redis_client()
+        with client.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.xadd(
+                    settings.REDIS_STREAM_KEY,
+                    _encode_message(message),
+                    maxlen=10000,  # Keep last 10000 messages
+                )
+            message_ids = pipe.execute()
+        logger.info(f"Jobs enqueued successfully: count={len(message_ids)}")
+        return message_ids
+    except RedisError as e:
+        logger.error(f"Failed to enqueue jobs: {e}", exc_info=True)
+        raise QueueError(f"Failed to enqueue jobs: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error enqueueing jobs: {e}", exc_info=True)
+        raise QueueError(f"Unexpected error enqueueing jobs: {str(e)}") from e
+
+
+@ttl_cache(settings.HEALTH_CHECK_CACHE_TTL_SECONDS)
 def check_redis_connection() -> bool:
     """Check if Redis connection is healthy."""
     try:
@@ -81,14 +144,9 @@ def check_redis_connection() -> bool:
         if redis_client is None:
             # Try to create client without raising exception
             try:
-                redis_client = redis.Redis.from_url(
-                    settings.REDIS_URL,
-                    socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
-                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
-                    decode_responses=False,
-                    retry_on_timeout=True,
-                    health_check_interval=30,
-                )
+                with _redis_client_lock:
+                    if redis_client is None:
+                        redis_client = _create_redis_client()
             except Exception:
                 return False
         
@@ -1,6 +1,7 @@
 """
 Authentication router for login and token management.
 """
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel
@@ -11,20 +12,12 @@ from app.auth import (
     create_refresh_token,
     decode_token,
     get_password_hash,
-    verify_password,
+    averify_password,
     get_current_user,
 )
-import bcrypt
-
-
-def verify_password_bcrypt(plain_password: str, hashed_password: str) -> bool:
-    """Verify password using bcrypt directly (bypassing passlib)."""
-    try:
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
-    except Exception:
-        return False
 from app.middleware.rate_limit import rate_limit
 from app.config import settings
+from app.constants import Role, Permission
 from app.logger import get_logger
 
 logger = get_logger(__name__)
@@ -62,23 +55,23 @@ class RefreshTokenRequest(BaseModel):
 
 # In-memory user store for demo purposes
 # In production, this should be in a database
-# Store plain passwords, will be hashed using bcrypt directly (bypassing passlib issues)
+# Store plain passwords, hashed on first access
 _DEMO_USERS_DATA = {
     "admin": {
         "user_id": "admin-001",
         "username": "admin",
         "email": "admin@example.com",
         "password": "admin123",
-        "roles": ["admin", "user"],
-        "permissions": ["read", "write", "admin"],
+        "roles_mask": Role.ADMIN | Role.USER,
+        "permissions_mask": Permission.READ | Permission.WRITE | Permission.ADMIN,
     },
     "user": {
         "user_id": "user-001",
         "username": "user",
         "email": "user@example.com",
         "password": "user123",
-        "roles": ["user"],
-        "permissions": ["read", "write"],
+        "roles_mask": Role.USER,
+        "permissions_mask": Permission.READ | Permission.WRITE,
     },
 }
 
@@ -86,20 +79,14 @@ _DEMO_USERS_DATA = {
 _DEMO_USERS_CACHE = {}
 
 
-def _hash_password_bcrypt(password: str) -> str:
-    """Hash password using bcrypt directly (bypassing passlib)."""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-
-
 def _get_demo_user(username: str) -> Optional[dict]:
-    """Get demo user, hashing password on first access using bcrypt directly."""
+    """Get demo user, hashing password on first access."""
     if username not in _DEMO_USERS_DATA:
         return None
     
     if username not in _DEMO_USERS_CACHE:
         user_data = _DEMO_USERS_DATA[username].copy()
-        # Use bcrypt directly to avoid passlib issues
-        user_data["hashed_password"] = _hash_password_bcrypt(user_data["password"])
+        user_data["hashed_password"] = get_password_hash(user_data["password"])
         del user_data["password"]
         _DEMO_USERS_CACHE[username] = user_data
     
@@ -137,7 +124,7 @@ DEMO_USERS = DemoUsers()
     description="Authenticate user and get access/refresh tokens",
 )
 @rate_limit(requests=5, period="minute")  # Limit login attempts
-def login(request: Request, credentials: LoginRequest) -> TokenResponse:
+async def login(request: Request, credentials: LoginRequest) -> TokenResponse:
     """
     Login endpoint.
     
@@ -152,10 +139,11 @@ def login(request: Request, credentials: LoginRequest) -> TokenResponse:
     Raises:
         HTTPException: If credentials are invalid
     """
-    user = DEMO_USERS.get(credentials.username)
+    # Both the first-access hash and the verify are bcrypt work; keep them
+    # off the event loop
+    user = await anyio.to_thread.run_sync(DEMO_USERS.get, credentials.username)
     
-    # Use bcrypt directly for demo users to avoid passlib issues
-    if not user or not verify_password_bcrypt(credentials.password, user["hashed_password"]):
+    if not user or not await averify_password(credentials.password, user["hashed_password"]):
         logger.warning(f"Failed login attempt for username: {credentials.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -168,8 +156,8 @@ def login(request: Request, credentials: LoginRequest) -> TokenResponse:
         "sub": user["user_id"],
         "username": user["username"],
         "email": user["email"],
-        "roles": user["roles"],
-        "permissions": user["permissions"],
+        "roles": user["roles_mask"].to_names(),
+        "permissions": user["permissions_mask"].to_names(),
     }
     
     access_token = create_access_token(token_data)
@@ -9,6 +9,7 @@ from app.schemas import (
     InitUploadRequest,
     InitUploadResponse,
     CompleteUploadRequest,
+    CompleteUploadsRequest,
 )
 from app.services.upload_service import UploadService
 from app.services.job_service import JobService
@@ -146,3 +147,63 @@ def complete_upload(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to complete upload",
         )
+
+
+@router.post(
+    "/files/complete/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Complete file uploads in batch",
+    description="Mark several uploads as complete and queue their jobs for processing",
+)
+@rate_limit(requests=20, period="minute")
+def complete_uploads(
+    request: Request,
+    req: CompleteUploadsRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+) -> dict:
+    """
+    Complete several file uploads.
+    
+    Verifies all files exist in storage and queues every job for processing.
+    If any check fails no job is changed. If enqueueing fails the jobs stay
+    CREATED in the database, but messages Redis already accepted are not
+    removed from the stream.
+    
+    Args:
+        req: Complete uploads request with job_ids
+        db: Database session
+        
+    Returns:
+        Success message with the queued jobs
+        
+    Raises:
+        HTTPException: If a job is not found, in an invalid state, or its file is missing
+    """
+    try:
+        jobs = UploadService.complete_uploads(db=db, job_ids=req.job_ids)
+        
+        logger.info(f"Uploads completed and queued: {len(jobs)} jobs")
+        
+        return {
+            "message": "Jobs queued successfully",
+            "jobs": [
+                {"job_id": job.job_id, "status": job.status}
+                for job in jobs
+            ],
+        }
+    except JobNotFoundError as e:
+        logger.warning(f"Jobs not found: {e}")
+        raise handle_service_exception(e)
+    except InvalidJobStateError as e:
+        logger.warning(f"Invalid job state: {e}")
+        raise handle_service_exception(e)
+    except StorageError as e:
+        logger.error(f"Storage error completing uploads: {e}")
+        raise handle_service_exception(e)
+    except Exception as e:
+        logger.error(f"Unexpected error completing uploads: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to complete uploads",
+        )
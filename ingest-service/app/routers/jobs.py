@@ -2,6 +2,9 @@
 Jobs router for job status and management.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -16,6 +19,9 @@ from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Validates and serializes job listings to JSON bytes in one pass in pydantic-core
+_JOB_LIST_ADAPTER = TypeAdapter(List[JobResponse])
+
 router = APIRouter(
     prefix="/jobs",
     tags=["jobs"],
@@ -94,7 +100,7 @@ def list_jobs(
     offset: int = Query(0, ge=0, description="Number of jobs to skip"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
-) -> List[JobResponse]:
+) -> Response:
     """
     List jobs with optional filtering.
     
@@ -106,27 +112,27 @@ def list_jobs(
         db: Database session
         
     Returns:
-        List of job responses
+        JSON response with the list of jobs
     """
     try:
-        query = db.query(Job)
+        # Select only the listed columns; rows skip ORM hydration and identity-map bookkeeping
+        stmt = select(Job.job_id, Job.status, Job.progress)
         
         if status_filter:
-            query = query.filter(Job.status == status_filter)
+            stmt = stmt.where(Job.status == status_filter)
         
         if job_type:
-            query = query.filter(Job.job_type == job_type)
+            stmt = stmt.where(Job.job_type == job_type)
         
-        jobs = query.order_by(Job.created_at.desc()).offset(offset).limit(limit).all()
+        stmt = stmt.order_by(Job.created_at.desc()).offset(offset).limit(limit)
+        rows = db.execute(stmt).all()
         
-        return [
-            JobResponse(
-                job_id=job.job_id,
-                status=job.status,
-                progress=job.progress,
-            )
-            for job in jobs
-        ]
+        return Response(
+            content=_JOB_LIST_ADAPTER.dump_json(
+                _JOB_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+            ),
+            media_type="application/json",
+        )
     except Exception as e:
         logger.error(f"Unexpected error listing jobs: {e}", exc_info=True)
         raise HTTPException(
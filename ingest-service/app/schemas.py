@@ -2,28 +2,27 @@
 Pydantic schemas for request/response validation.
 """
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 
+from app.constants import LogFormat
+
 
 class InitUploadRequest(BaseModel):
     """Request schema for initializing file upload."""
     
     filename: str = Field(..., description="Original filename", min_length=1, max_length=255)
     size: int = Field(..., description="File size in bytes", gt=0)
-    log_format: str = Field(
-        default="json",
+    log_format: LogFormat = Field(
+        default=LogFormat.JSON,
         description="Log format (json, text, csv, ndjson)",
     )
     
-    @field_validator("log_format")
+    @field_validator("log_format", mode="before")
     @classmethod
-    def validate_log_format(cls, v: str) -> str:
-        """Validate log format."""
-        allowed = {"json", "text", "csv", "ndjson"}
-        if v.lower() not in allowed:
-            raise ValueError(f"log_format must be one of {allowed}")
-        return v.lower()
+    def normalize_log_format(cls, v):
+        """Lowercase log format so enum validation is case-insensitive."""
+        return v.lower() if isinstance(v, str) else v
 
 
 class InitUploadResponse(BaseModel):
@@ -50,6 +49,24 @@ class CompleteUploadRequest(BaseModel):
     }}}
 
 
+class CompleteUploadsRequest(BaseModel):
+    """Request schema for completing several file uploads at once."""
+    
+    job_ids: List[str] = Field(
+        ...,
+        description="Job IDs",
+        min_length=1,
+        max_length=1000,
+    )
+    
+    model_config = {"json_schema_extra": {"example": {
+        "job_ids": [
+            "123e4567-e89b-12d3-a456-426614174000",
+            "123e4567-e89b-12d3-a456-426614174001",
+        ],
+    }}}
+
+
 class JobResponse(BaseModel):
     """Basic job response schema."""
     
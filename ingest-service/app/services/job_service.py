@@ -2,7 +2,8 @@
 Job service for managing job operations.
 """
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models import Job, FileUpload
@@ -12,6 +13,15 @@ from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Timestamp column stamped when a job enters each status
+_STATUS_TIMESTAMP_FIELDS = {
+    JobStatus.QUEUED: "queued_at",
+    JobStatus.PROCESSING: "started_at",
+    JobStatus.COMPLETED: "finished_at",
+    JobStatus.FAILED: "finished_at",
+    JobStatus.CANCELLED: "finished_at",
+}
+
 
 class JobService:
     """Service for job management operations."""
@@ -102,19 +112,54 @@ class JobService:
         if error_message:
             job.error_message = error_message
         
-        now = datetime.now(timezone.utc)
-        
-        if status == JobStatus.QUEUED:
-            job.queued_at = now
-        elif status == JobStatus.PROCESSING:
-            job.started_at = now
-        elif status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-            job.finished_at = now
+        timestamp_field = _STATUS_TIMESTAMP_FIELDS.get(status)
+        if timestamp_field:
+            setattr(job, timestamp_field, datetime.now(timezone.utc))
         
         db.flush()
         logger.info(f"Updated job status: job_id={job.job_id}, status={status.value}")
         return job
     
+    @staticmethod
+    def update_jobs_status(
+        db: Session,
+        job_ids: List[str],
+        status: JobStatus,
+    ) -> int:
+        """
+        Update the status of several jobs with a single UPDATE statement.
+        
+        Jobs already loaded in the session have the updated columns expired,
+        so their new values are loaded on next access.
+        
+        Args:
+            db: Database session
+            job_ids: Job IDs to update
+            status: New status
+            
+        Returns:
+            Number of updated rows
+        """
+        values = {"status": status.value}
+        timestamp_field = _STATUS_TIMESTAMP_FIELDS.get(status)
+        if timestamp_field:
+            values[timestamp_field] = datetime.now(timezone.utc)
+        
+        result = db.execute(
+            update(Job)
+            .where(Job.job_id.in_(job_ids))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        
+        expired = [*values, "updated_at"]
+        job_id_set = set(job_ids)
+        for obj in list(db.identity_map.values()):
+            if isinstance(obj, Job) and obj.job_id in job_id_set:
+                db.expire(obj, expired)
+        logger.info(f"Updated status of {result.rowcount} jobs to {status.value}")
+        return result.rowcount
+    
     @staticmethod
     def validate_job_state(job: Job, expected_status: JobStatus) -> None:
         """
@@ -2,20 +2,26 @@
 Upload service for handling file upload operations.
 """
 import uuid
-from typing import Tuple
+from typing import List, Tuple, Union
 from sqlalchemy.orm import Session
 
 from app.models import Job, FileUpload
 from app.constants import JobType, JobStatus, StorageType, LogFormat
 from app.config import settings
-from app.storage import generate_presigned_put, object_exists
-from app.queue import enqueue_job
+from app.storage import generate_presigned_put, object_exists, find_existing_objects
+from app.queue import enqueue_job, enqueue_jobs
 from app.services.job_service import JobService
 from app.logger import get_logger
-from app.exceptions import StorageError
+from app.exceptions import JobNotFoundError, StorageError
 
 logger = get_logger(__name__)
 
+# Upper bound on the file extension carried into storage object keys
+MAX_FILE_EXTENSION_LENGTH = 16
+
+# Log format lookup; str-valued enum members hash and compare like their values
+_LOG_FORMATS = {log_format.value: log_format for log_format in LogFormat}
+
 
 class UploadService:
     """Service for file upload operations."""
@@ -25,7 +31,7 @@ class UploadService:
         db: Session,
         filename: str,
         size: int,
-        log_format: str = "json",
+        log_format: Union[LogFormat, str] = LogFormat.JSON,
     ) -> Tuple[Job, FileUpload, str]:
         """
         Initialize a file upload.
@@ -39,10 +45,9 @@ class UploadService:
         Returns:
             Tuple of (job, file_upload, presigned_url)
         """
-        # Validate log format
-        try:
-            log_format_enum = LogFormat(log_format.lower())
-        except ValueError:
+        # Validate log format (already a LogFormat when coming from the API schema)
+        log_format_enum = _LOG_FORMATS.get(log_format) or _LOG_FORMATS.get(log_format.lower())
+        if log_format_enum is None:
             log_format_enum = LogFormat.JSON
             logger.warning(f"Invalid log format '{log_format}', defaulting to JSON")
         
@@ -55,7 +60,8 @@ class UploadService:
         )
         
         # Generate object key
-        file_extension = filename.split(".")[-1] if "." in filename else "log"
+        _, sep, extension = filename.rpartition(".")
+        file_extension = extension[:MAX_FILE_EXTENSION_LENGTH] if sep and extension else "log"
         object_key = f"raw-logs/{job.job_id}.{file_extension}"
         
         # Create file upload metadata
@@ -147,4 +153,87 @@ class UploadService:
         logger.info(f"Completed upload and queued job: job_id={job_id}")
         
         return job
-
+    
+    @staticmethod
+    def complete_uploads(db: Session, job_ids: List[str]) -> List[Job]:
+        """
+        Complete several file uploads and queue their jobs for processing.
+        
+        Loads jobs and upload metadata with one query each, verifies all files
+        with a single storage listing, marks the jobs QUEUED with one UPDATE and
+        enqueues them in one pipelined round trip. Validation is all-or-nothing;
+        if enqueueing fails the status change is rolled back, but messages
+        already accepted by Redis stay in the stream.
+        
+        Args:
+            db: Database session
+            job_ids: Job IDs
+            
+        Returns:
+            Updated job instances, in request order
+            
+        Raises:
+            JobNotFoundError: If any job or its upload metadata is not found
+            InvalidJobStateError: If any job is not in CREATED state
+            StorageError: If any file doesn't exist in storage
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        
+        # Get jobs
+        jobs = {job.job_id: job for job in db.query(Job).filter(Job.job_id.in_(job_ids))}
+        missing_jobs = [job_id for job_id in job_ids if job_id not in jobs]
+        if missing_jobs:
+            raise JobNotFoundError(f"Jobs not found: {', '.join(missing_jobs)}")
+        
+        # Validate job states
+        for job in jobs.values():
+            JobService.validate_job_state(job, JobStatus.CREATED)
+        
+        # Get file upload metadata
+        uploads = {
+            upload.job_id: upload
+            for upload in db.query(FileUpload).filter(FileUpload.job_id.in_(job_ids))
+        }
+        missing_uploads = [job_id for job_id in job_ids if job_id not in uploads]
+        if missing_uploads:
+            raise JobNotFoundError(
+                f"File upload metadata not found for jobs: {', '.join(missing_uploads)}"
+            )
+        
+        # Verify files exist in storage
+        existing = find_existing_objects(upload.object_key for upload in uploads.values())
+        missing_files = [
+            upload.object_key for upload in uploads.values() if upload.object_key not in existing
+        ]
+        if missing_files:
+            logger.error(f"Storage verification failed for {len(missing_files)} files")
+            raise StorageError(f"Files not found in storage: {', '.join(missing_files)}")
+        
+        # Update job statuses to QUEUED
+        JobService.update_jobs_status(db, job_ids, JobStatus.QUEUED)
+        
+        # Enqueue jobs for processing
+        try:
+            enqueue_jobs([
+                {
+                    "job_id": job_id,
+                    "job_type": jobs[job_id].job_type,
+                    "payload": {
+                        "bucket": uploads[job_id].bucket,
+                        "key": uploads[job_id].object_key,
+                        "log_format": uploads[job_id].log_format,
+                        "file_size": uploads[job_id].file_size,
+                    }
+                }
+                for job_id in job_ids
+            ])
+        except Exception as e:
+            logger.error(f"Failed to enqueue jobs: {e}")
+            # Rollback status change
+            db.rollback()
+            raise
+        
+        db.commit()
+        logger.info(f"Completed uploads and queued {len(job_ids)} jobs")
+        
+        return [jobs[job_id] for job_id in job_ids]
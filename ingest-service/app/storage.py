@@ -1,12 +1,15 @@
 """
 S3/MinIO storage operations.
 """
-from typing import Optional
+import math
+import os
+from typing import Iterable, Optional, Set
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 from botocore.config import Config
 
 from app.config import settings
+from app.cache import ttl_cache
 from app.logger import get_logger
 from app.exceptions import StorageError
 
@@ -20,10 +23,15 @@ s3_config = Config(
     },
     connect_timeout=10,
     read_timeout=10,
+    # botocore defaults to 10 pooled connections, which caps concurrent S3 calls
+    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+    signature_version="s3v4",
+    s3={"addressing_style": settings.S3_ADDRESSING_STYLE},
 )
 
-# Create S3 client
-s3_client = boto3.client(
+# Create S3 client once per process from a dedicated session; the client
+# (and its keep-alive connection pool and request signer) is reused by all calls
+s3_client = boto3.session.Session().client(
     "s3",
     endpoint_url=settings.S3_ENDPOINT,
     aws_access_key_id=settings.S3_ACCESS_KEY,
@@ -106,6 +114,81 @@ def object_exists(key: str) -> bool:
         raise StorageError(f"Unexpected error: {str(e)}") from e
 
 
+def find_existing_objects(keys: Iterable[str]) -> Set[str]:
+    """
+    Find which of the given objects exist in S3.
+    
+    Lists objects under the keys' common prefix instead of issuing a HEAD
+    request per object. S3 lists keys in sorted order, so the listing starts
+    just below the smallest key and stops once it has passed the largest one.
+    Keys spread over a wide range (e.g. an old and a new job, since job IDs
+    are time-ordered) can have many unrelated objects between them, so at
+    most ``ceil(len(keys) / 1000) + 1`` pages are listed; keys not resolved
+    by then are checked with ``object_exists``.
+    
+    Args:
+        keys: Object keys in S3
+        
+    Returns:
+        Subset of keys that exist
+        
+    Raises:
+        StorageError: If listing fails
+    """
+    expected = set(keys)
+    if not expected:
+        return set()
+    
+    first_key, last_key = min(expected), max(expected)
+    params = {
+        "Bucket": settings.S3_BUCKET,
+        "Prefix": os.path.commonprefix(list(expected)),
+        # A proper prefix sorts before the key itself, and StartAfter is exclusive
+        "StartAfter": first_key[:-1],
+        "MaxKeys": 1000,
+    }
+    max_pages = math.ceil(len(expected) / 1000) + 1
+    found: Set[str] = set()
+    listed_through = ""  # expected keys <= this were covered by the listing
+    
+    try:
+        for _ in range(max_pages):
+            response = s3_client.list_objects_v2(**params)
+            contents = response.get("Contents", [])
+            for obj in contents:
+                if obj["Key"] in expected:
+                    found.add(obj["Key"])
+            
+            if (
+                len(found) == len(expected)
+                or not response.get("IsTruncated")
+                or (contents and contents[-1]["Key"] > last_key)
+            ):
+                listed_through = last_key
+                break
+            if contents:
+                listed_through = contents[-1]["Key"]
+            params["ContinuationToken"] = response["NextContinuationToken"]
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code", "Unknown")
+        logger.error(f"Error listing objects: {error_code} - {e}")
+        raise StorageError(f"Failed to list objects: {error_code}") from e
+    except BotoCoreError as e:
+        logger.error(f"BotoCore error listing objects: {e}")
+        raise StorageError(f"Storage service error: {str(e)}") from e
+    except Exception as e:
+        logger.error(f"Unexpected error listing objects: {e}", exc_info=True)
+        raise StorageError(f"Unexpected error: {str(e)}") from e
+    
+    unlisted = sorted(key for key in expected if key > listed_through)
+    if unlisted:
+        logger.debug(f"Listing page limit reached; checking {len(unlisted)} objects individually")
+        found.update(key for key in unlisted if object_exists(key))
+    
+    logger.debug(f"Found {len(found)} of {len(expected)} objects under prefix {params['Prefix']}")
+    return found
+
+
 def get_object_size(key: str) -> Optional[int]:
     """
     Get the size of an object in S3.
@@ -138,6 +221,7 @@ def get_object_size(key: str) -> Optional[int]:
         raise StorageError(f"Unexpected error: {str(e)}") from e
 
 
+@ttl_cache(settings.HEALTH_CHECK_CACHE_TTL_SECONDS)
 def check_storage_connection() -> bool:
     """Check if storage connection is healthy."""
     try:
@@ -1,23 +1,43 @@
 """
 Pytest configuration and shared fixtures.
 """
+import os
+
+# The rate limiter picks its storage at import time; keep counters in
+# process memory instead of connecting to Redis
+os.environ.setdefault("RATE_LIMIT_STORAGE_URI", "memory://")
+
+import httpx
 import pytest
-from typing import Generator
-from unittest.mock import Mock, MagicMock, patch
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+import pytest_asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import AsyncGenerator, Generator
+from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, configure_mappers
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from faker import Faker
+import fakeredis
 
-from app.database import Base, get_db
+from app.database import Base, get_db, check_db_connection
+from app.queue import check_redis_connection
+from app.storage import check_storage_connection
 from app.main import app
+from app.middleware.rate_limit import limiter
 from app.config import settings
 from app.models import Job, FileUpload
 from app.constants import JobStatus, JobType, StorageType, LogFormat
 
+# Resolve model relationships at collection time, not on the first query
+configure_mappers()
+
 fake = Faker()
 
+# Timestamp for fixture rows, so they don't read the clock
+FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 # Override settings for testing
 @pytest.fixture(scope="session", autouse=True)
@@ -27,42 +47,106 @@ def setup_test_settings():
     settings.DATABASE_URL = "sqlite:///:memory:"
     settings.DEBUG = True
     settings.ENVIRONMENT = "development"
+    # Minimum bcrypt cost: 2^4 rounds instead of 2^12 keeps hashing cheap
+    settings.BCRYPT_ROUNDS = 4
     yield
     # Cleanup if needed
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start each test with empty rate limit counters."""
+    limiter.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_health_check_caches():
+    """Start each test with fresh dependency health check results."""
+    check_db_connection.cache_clear()
+    check_redis_connection.cache_clear()
+    check_storage_connection.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def db_engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once per session."""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    
+    # pysqlite's implicit transaction handling breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(bind=engine)
     yield engine
-    Base.metadata.drop_all(bind=engine)
     engine.dispose()
 
 
 @pytest.fixture(scope="function")
 def db_session(db_engine) -> Generator[Session, None, None]:
-    """Create a test database session."""
-    TestingSessionLocal = sessionmaker(
-        autocommit=False,
+    """
+    Create a test database session inside a SAVEPOINT that is rolled back.
+    
+    The test's connection transaction and SAVEPOINT both end at teardown,
+    so the shared engine connection is idle again for code that connects
+    to the engine itself. Commits and rollbacks made by the code under
+    test only act on the session's own nested SAVEPOINT.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    savepoint = connection.begin_nested()
+    session = Session(
+        bind=connection,
         autoflush=False,
-        bind=db_engine,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
-    session = TestingSessionLocal()
     try:
         yield session
     finally:
         session.close()
+        if savepoint.is_active:
+            savepoint.rollback()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_client() -> TestClient:
+    """
+    Create one test client for tests that need no dependency overrides.
+    
+    Not entered as a context manager, so the lifespan (init_db against the
+    configured database) does not run.
+    """
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture
+async def async_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Call the app in-process through httpx's ASGI transport.
+    
+    Skips TestClient's thread/portal bridge; like app_client, it does not
+    run the lifespan.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
-def client(db_session) -> TestClient:
-    """Create a test client with database override."""
+def client(app_client, db_session) -> TestClient:
+    """Session test client with the database bound to this test's session."""
     def override_get_db():
         try:
             yield db_session
@@ -70,41 +154,57 @@ def client(db_session) -> TestClient:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
-    yield TestClient(app)
+    yield app_client
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
 def sample_job(db_session) -> Job:
-    """Create a sample job for testing."""
-    job = Job(
-        job_id="test-job-id",
-        job_type=JobType.FILE_UPLOAD.value,
-        source="test",
-        status=JobStatus.CREATED.value,
-        progress=0,
-        retry_count=0,
+    """
+    Create a sample job for testing.
+    
+    The row is written with a Core INSERT and then loaded, so the fixture
+    skips the ORM unit of work but still returns a managed instance.
+    """
+    db_session.execute(
+        insert(Job),
+        [{
+            "job_id": "test-job-id",
+            "job_type": JobType.FILE_UPLOAD.value,
+            "source": "test",
+            "status": JobStatus.CREATED.value,
+            "progress": 0,
+            "retry_count": 0,
+            "created_at": FIXED_NOW,
+            "updated_at": FIXED_NOW,
+        }],
     )
-    db_session.add(job)
     db_session.commit()
-    db_session.refresh(job)
-    return job
+    return db_session.get(Job, "test-job-id")
 
 
 @pytest.fixture
-def sample_file_upload(db_session, sample_job) -> FileUpload:
-    """Create a sample file upload for testing."""
-    upload = FileUpload(
-        job_id=sample_job.job_id,
-        storage_type=StorageType.S3.value,
-        bucket="test-bucket",
-        object_key="test-key.log",
-        file_size=1024,
-        log_format=LogFormat.JSON.value,
+def sample_file_upload(db_session, sample_job) -> SimpleNamespace:
+    """
+    Create a sample file upload for testing.
+    
+    Tests only read ``job_id`` and ``object_key``, so the row is inserted
+    with Core and those values are returned without loading a FileUpload.
+    """
+    upload = SimpleNamespace(job_id=sample_job.job_id, object_key="test-key.log")
+    db_session.execute(
+        insert(FileUpload),
+        [{
+            "job_id": upload.job_id,
+            "storage_type": StorageType.S3.value,
+            "bucket": "test-bucket",
+            "object_key": upload.object_key,
+            "file_size": 1024,
+            "log_format": LogFormat.JSON.value,
+            "created_at": FIXED_NOW,
+        }],
     )
-    db_session.add(upload)
     db_session.commit()
-    db_session.refresh(upload)
     return upload
 
 
@@ -120,14 +220,47 @@ def mock_redis():
 
 
 @pytest.fixture
-def mock_s3():
-    """Mock S3 client."""
-    with patch("app.storage.s3_client") as mock:
-        mock_s3_client = MagicMock()
-        mock_s3_client.generate_presigned_url.return_value = "https://test-presigned-url.com"
-        mock_s3_client.head_object.return_value = {"ContentLength": 1024}
-        mock_s3_client.list_buckets.return_value = {"Buckets": []}
-        yield mock_s3_client
+def fake_redis(monkeypatch):
+    """In-memory Redis server installed as the queue module's client."""
+    client = fakeredis.FakeRedis(server=fakeredis.FakeServer())
+    monkeypatch.setattr("app.queue.redis_client", client)
+    yield client
+    client.close()
+
+
+def _configure_s3_stub(client: MagicMock) -> None:
+    """Give the S3 stub successful default responses."""
+    client.generate_presigned_url.return_value = "https://test-presigned-url.com"
+    client.head_object.return_value = {"ContentLength": 1024}
+    client.list_buckets.return_value = {"Buckets": []}
+    client.list_objects_v2.return_value = {"Contents": [], "IsTruncated": False}
+
+
+# S3 client methods app.storage calls; anything else on the stub is an error
+S3_CLIENT_METHODS = ["generate_presigned_url", "head_object", "list_buckets", "list_objects_v2"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def s3_stub():
+    """Replace the boto3 S3 client for the whole session so no test reaches storage."""
+    client = MagicMock(spec=S3_CLIENT_METHODS)
+    _configure_s3_stub(client)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.storage.s3_client", client)
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def mock_s3(s3_stub):
+    """
+    Session S3 stub, reset to its default responses for this test.
+    
+    Autouse, so a ``side_effect`` left by one test never leaks into the
+    next regardless of test order.
+    """
+    s3_stub.reset_mock(return_value=True, side_effect=True)
+    _configure_s3_stub(s3_stub)
+    yield s3_stub
 
 
 @pytest.fixture
@@ -138,14 +271,36 @@ def mock_enqueue_job():
         yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def bcrypt_sample(setup_test_settings):
+    """Hash a sample password once for the whole test session."""
+    from app.auth import get_password_hash
+    password = "testpassword123"
+    return password, get_password_hash(password)
+
+
+@pytest.fixture(scope="session")
+def sample_access_token():
+    """Create a sample access token once for the whole test session."""
+    from app.auth import create_access_token
+    return create_access_token({"sub": "user-123", "username": "testuser"})
+
+
+@pytest.fixture(scope="session")
+def sample_refresh_token():
+    """Create a sample refresh token once for the whole test session."""
+    from app.auth import create_refresh_token
+    return create_refresh_token({"sub": "user-123", "username": "testuser"})
+
+
+@pytest.fixture(scope="session")
 def auth_token():
-    """Create a test authentication token."""
+    """Create a test authentication token once for the whole session."""
     from app.auth import create_test_token
     return create_test_token(user_id="test-user-001", username="testuser")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers(auth_token):
     """Create authentication headers."""
     return {"Authorization": f"Bearer {auth_token}"}
@@ -1,74 +1,97 @@
 """
 Tests for authentication module.
 """
+import asyncio
+import jwt
 import pytest
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from app.auth import (
+    _decode_verified,
     create_access_token,
-    create_refresh_token,
     decode_token,
     verify_password,
     get_password_hash,
-    get_current_user,
+    averify_password,
     create_test_token,
 )
-from app.exceptions import ValidationError
+from app.config import settings
+from app.constants import Permission, Role
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 
 
 class TestAuth:
-    """Test cases for authentication module."""
+    """
+    Test cases for authentication module.
     
-    def test_get_password_hash(self):
+    bcrypt cost is intentionally reduced to 4 for the test run (see
+    setup_test_settings in conftest.py); production uses BCRYPT_ROUNDS.
+    """
+    
+    def test_get_password_hash(self, bcrypt_sample):
         """Test password hashing."""
-        password = "testpassword123"
-        hashed = get_password_hash(password)
+        password, hashed = bcrypt_sample
         
         assert hashed != password
         assert len(hashed) > 0
-        assert hashed.startswith("$2b$")  # bcrypt hash format
+        assert hashed.startswith("$2b$04$")  # bcrypt hash format, test cost
     
-    def test_verify_password_success(self):
+    def test_verify_password_success(self, bcrypt_sample):
         """Test password verification with correct password."""
-        password = "testpassword123"
-        hashed = get_password_hash(password)
+        password, hashed = bcrypt_sample
         
         assert verify_password(password, hashed) is True
     
-    def test_verify_password_failure(self):
+    def test_verify_password_failure(self, bcrypt_sample):
         """Test password verification with incorrect password."""
-        password = "testpassword123"
-        hashed = get_password_hash(password)
+        _, hashed = bcrypt_sample
         
         assert verify_password("wrongpassword", hashed) is False
     
-    def test_create_access_token(self):
+    @pytest.mark.parametrize(
+        "hashed",
+        ["", "not-a-hash", "$2b$04$truncated", "$1$" + "x" * 57],
+    )
+    def test_verify_password_malformed_hash_fastpath(self, hashed):
+        """Test malformed hashes are rejected without running bcrypt."""
+        with patch("app.auth.bcrypt.checkpw") as mock_checkpw:
+            assert verify_password("testpassword123", hashed) is False
+        
+        mock_checkpw.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_verify_password_concurrent(self):
+        """Test concurrent async verifications each get the right result."""
+        passwords = [f"password-{i}" for i in range(4)]
+        hashes = [get_password_hash(p) for p in passwords]
+        results = await asyncio.gather(
+            *(averify_password(p, h) for p, h in zip(passwords, hashes)),
+            averify_password("wrongpassword", hashes[0]),
+        )
+        
+        assert results == [True, True, True, True, False]
+    
+    def test_create_access_token(self, sample_access_token):
         """Test access token creation."""
-        data = {"sub": "user-123", "username": "testuser"}
-        token = create_access_token(data)
+        token = sample_access_token
         
         assert token is not None
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_create_refresh_token(self):
+    def test_create_refresh_token(self, sample_refresh_token):
         """Test refresh token creation."""
-        data = {"sub": "user-123", "username": "testuser"}
-        token = create_refresh_token(data)
+        token = sample_refresh_token
         
         assert token is not None
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_decode_token_success(self):
+    def test_decode_token_success(self, sample_access_token):
         """Test successful token decoding."""
-        data = {"sub": "user-123", "username": "testuser"}
-        token = create_access_token(data)
-        
-        payload = decode_token(token)
+        payload = decode_token(sample_access_token)
         
         assert payload["sub"] == "user-123"
         assert payload["username"] == "testuser"
@@ -86,15 +109,14 @@ class TestAuth:
     
     def test_decode_token_expired(self):
         """Test token decoding with expired token."""
-        from datetime import datetime, timezone
-        
         # Create token with past expiration
-        data = {"sub": "user-123", "exp": datetime.now(timezone.utc) - timedelta(hours=1)}
+        data = {
+            "sub": "user-123",
+            "exp": datetime.now(timezone.utc) - timedelta(hours=1),
+            "iat": datetime.now(timezone.utc) - timedelta(hours=2),
+        }
         
         # Manually create expired token
-        from jose import jwt
-        from app.config import settings
-        
         expired_token = jwt.encode(
             data,
             settings.JWT_SECRET_KEY,
@@ -106,6 +128,45 @@ class TestAuth:
         
         assert exc_info.value.status_code == 401
     
+    def test_decode_token_missing_iat(self):
+        """Test token decoding rejects tokens without an iat claim."""
+        token = jwt.encode(
+            {"sub": "user-123", "exp": datetime.now(timezone.utc) + timedelta(hours=1)},
+            settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM,
+        )
+        
+        with pytest.raises(HTTPException) as exc_info:
+            decode_token(token)
+        
+        assert exc_info.value.status_code == 401
+    
+    def test_decode_token_cached(self):
+        """Test repeated decodes of the same token hit the cache."""
+        _decode_verified.cache_clear()
+        token = create_test_token(user_id="cached-user")
+        
+        with patch("app.auth.jwt.decode", wraps=jwt.decode) as mock_decode:
+            first = decode_token(token)
+            first["sub"] = "tampered"
+            first["roles"].append("admin")
+            second = decode_token(token)
+        
+        assert mock_decode.call_count == 1
+        assert second["sub"] == "cached-user"
+        assert second["roles"] == ["user"]
+    
+    def test_decode_token_cached_then_expired(self):
+        """Test a cached token is rejected once it expires."""
+        token = create_access_token({"sub": "user-123"})
+        decode_token(token)
+        
+        with patch("app.auth.time.time", return_value=10**12):
+            with pytest.raises(HTTPException) as exc_info:
+                decode_token(token)
+        
+        assert exc_info.value.status_code == 401
+    
     def test_create_test_token(self):
         """Test test token creation."""
         token = create_test_token(user_id="test-123", username="testuser")
@@ -118,8 +179,6 @@ class TestAuth:
     @patch("app.auth.security")
     def test_get_current_user_success(self, mock_security):
         """Test getting current user with valid token."""
-        from fastapi.security import HTTPAuthorizationCredentials
-        
         # Create a valid token
         token = create_test_token(user_id="user-123", username="testuser")
         
@@ -134,19 +193,17 @@ class TestAuth:
         # and would be called differently
         pass  # Would need more complex mocking for full test
     
-    def test_token_contains_refresh_type(self):
+    def test_token_contains_refresh_type(self, sample_refresh_token):
         """Test that refresh token contains type field."""
-        data = {"sub": "user-123", "username": "testuser"}
-        refresh_token = create_refresh_token(data)
-        
-        payload = decode_token(refresh_token)
+        payload = decode_token(sample_refresh_token)
         assert payload.get("type") == "refresh"
     
-    def test_access_token_does_not_contain_type(self):
+    def test_access_token_does_not_contain_type(self, sample_access_token):
         """Test that access token does not contain type field."""
-        data = {"sub": "user-123", "username": "testuser"}
-        access_token = create_access_token(data)
-        
-        payload = decode_token(access_token)
+        payload = decode_token(sample_access_token)
         assert payload.get("type") is None
-
+    
+    def test_mask_to_names(self):
+        """Test masks render as claim names in the original claim order."""
+        assert (Permission.READ | Permission.ADMIN).to_names() == ["read", "admin"]
+        assert (Role.ADMIN | Role.USER).to_names() == ["admin", "user"]
@@ -1,12 +1,12 @@
 """
 Tests for database module.
 """
-import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import inspect
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.database import get_db, check_db_connection, init_db
+from app.database import get_db, get_db_context, check_db_connection
 from app.models import Job
-from app.constants import JobStatus, JobType
 
 
 class TestDatabase:
@@ -14,8 +14,6 @@ class TestDatabase:
     
     def test_get_db_context(self, db_session):
         """Test database context manager."""
-        from app.database import get_db_context
-        
         with get_db_context() as db:
             assert db is not None
             # Test that we can query
@@ -36,26 +34,34 @@ class TestDatabase:
         except StopIteration:
             pass
     
-    def test_check_db_connection_success(self, db_engine):
+    def test_check_db_connection_success(self, db_engine, monkeypatch):
         """Test successful database connection check."""
-        # Patch the engine to use test engine
-        from app import database
-        original_engine = database.engine
-        database.engine = db_engine
+        monkeypatch.setattr("app.database.engine", db_engine)
         
-        try:
-            result = check_db_connection()
-            # Should return True if connection works
-            assert result is True
-        finally:
-            database.engine = original_engine
+        assert check_db_connection() is True
+    
+    def test_check_db_connection_failure(self, monkeypatch):
+        """Test database connection check failure."""
+        broken_engine = MagicMock()
+        broken_engine.connect.side_effect = SQLAlchemyError("Connection refused")
+        monkeypatch.setattr("app.database.engine", broken_engine)
+        
+        assert check_db_connection() is False
+    
+    def test_check_db_connection_cached(self, monkeypatch):
+        """Test a second check within the TTL reuses the first result."""
+        mock_engine = MagicMock()
+        monkeypatch.setattr("app.database.engine", mock_engine)
+        
+        assert check_db_connection() is True
+        assert check_db_connection() is True
+        
+        mock_engine.connect.assert_called_once()
     
     def test_init_db(self, db_engine):
         """Test database initialization."""
         # Tables should already be created by fixture
         # Just verify they exist
-        from sqlalchemy import inspect
-        
         inspector = inspect(db_engine)
         tables = inspector.get_table_names()
         
@@ -1,7 +1,6 @@
 """
 Tests for exceptions module.
 """
-import pytest
 from fastapi import HTTPException
 
 from app.exceptions import (
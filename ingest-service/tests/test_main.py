@@ -1,16 +1,19 @@
 """
 Tests for main application.
 """
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+
+from app.main import app
 
 
 class TestMain:
     """Test cases for main application."""
     
-    def test_root_endpoint(self, client):
+    @pytest.mark.asyncio
+    async def test_root_endpoint(self, async_client):
         """Test root endpoint."""
-        response = client.get("/")
+        response = await async_client.get("/")
         
         assert response.status_code == 200
         data = response.json()
@@ -19,16 +22,37 @@ class TestMain:
         assert "status" in data
         assert data["status"] == "running"
     
-    def test_openapi_docs_available_in_dev(self, client):
+    @pytest.mark.asyncio
+    async def test_openapi_docs_available_in_dev(self, async_client):
         """Test that OpenAPI docs are available in development."""
-        response = client.get("/docs")
+        response = await async_client.get("/docs")
         
         # Should be available in test environment (development)
         assert response.status_code in [200, 307]  # 307 for redirect
     
-    def test_openapi_json_available(self, client):
+    @pytest.mark.asyncio
+    async def test_swagger_oauth2_redirect_available_in_dev(self, async_client):
+        """Test that the Swagger UI OAuth2 redirect page is served."""
+        response = await async_client.get("/docs/oauth2-redirect")
+        
+        assert response.status_code == 200
+        assert "oauth2" in response.text.lower()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/docs", "/redoc"])
+    async def test_docs_use_root_path(self, path):
+        """Test docs pages point at the schema under a proxy's root path."""
+        transport = httpx.ASGITransport(app=app, root_path="/ingest")
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(path)
+        
+        assert response.status_code == 200
+        assert "/ingest/openapi.json" in response.text
+    
+    @pytest.mark.asyncio
+    async def test_openapi_json_available(self, async_client):
         """Test that OpenAPI JSON is available."""
-        response = client.get("/openapi.json")
+        response = await async_client.get("/openapi.json")
         
         assert response.status_code == 200
         data = response.json()
@@ -36,9 +60,10 @@ class TestMain:
         assert "info" in data
         assert "paths" in data
     
-    def test_cors_headers(self, client):
+    @pytest.mark.asyncio
+    async def test_cors_headers(self, async_client):
         """Test CORS headers are present."""
-        response = client.options(
+        response = await async_client.options(
             "/",
             headers={
                 "Origin": "http://localhost:3000",
@@ -50,9 +75,10 @@ class TestMain:
         # The exact response depends on CORS configuration
         assert response.status_code in [200, 204, 405]
     
-    def test_process_time_header(self, client):
+    @pytest.mark.asyncio
+    async def test_process_time_header(self, async_client):
         """Test that process time header is added."""
-        response = client.get("/")
+        response = await async_client.get("/")
         
         assert "X-Process-Time" in response.headers
         assert float(response.headers["X-Process-Time"]) >= 0
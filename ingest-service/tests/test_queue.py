@@ -1,108 +1,146 @@
 """
 Tests for queue module.
 """
+import orjson
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from redis.exceptions import RedisError, ConnectionError as RedisConnectionError
 
-from app.queue import enqueue_job, check_redis_connection, get_redis_client
+import app.queue
+from app.config import settings
+from app.queue import enqueue_job, enqueue_jobs, check_redis_connection, get_redis_client
 from app.exceptions import QueueError
 
 
+@pytest.fixture(autouse=True)
+def reset_redis_singleton(monkeypatch):
+    """Start each test without a cached client and restore the original after."""
+    monkeypatch.setattr("app.queue.redis_client", None)
+
+
+@pytest.fixture
+def mock_client():
+    """Mock Redis client."""
+    client = MagicMock()
+    client.ping.return_value = True
+    client.xadd.return_value = b"test-message-id"
+    return client
+
+
 class TestQueue:
     """Test cases for queue module."""
     
-    @patch("app.queue.get_redis_client")
-    def test_enqueue_job_success(self, mock_get_client):
+    def test_enqueue_job_success(self, fake_redis):
         """Test successful job enqueue."""
-        mock_client = MagicMock()
-        mock_client.xadd.return_value = b"test-message-id"
-        mock_get_client.return_value = mock_client
+        message = {"job_id": "test-job", "type": "test"}
+        message_id = enqueue_job(message)
         
-        message_id = enqueue_job({"job_id": "test-job", "type": "test"})
-        
-        assert message_id == b"test-message-id"
-        mock_client.xadd.assert_called_once()
+        entries = fake_redis.xrange(settings.REDIS_STREAM_KEY)
+        assert fake_redis.xlen(settings.REDIS_STREAM_KEY) == 1
+        assert entries[0][0] == message_id
+        assert orjson.loads(entries[0][1][b"data"]) == message
     
-    @patch("app.queue.get_redis_client")
-    def test_enqueue_job_redis_error(self, mock_get_client):
+    def test_enqueue_job_redis_error(self, monkeypatch, mock_client):
         """Test job enqueue with Redis error."""
-        from redis.exceptions import RedisError
-        
-        mock_client = MagicMock()
         mock_client.xadd.side_effect = RedisError("Redis error")
-        mock_get_client.return_value = mock_client
+        monkeypatch.setattr("app.queue.get_redis_client", lambda: mock_client)
         
         with pytest.raises(QueueError) as exc_info:
             enqueue_job({"job_id": "test-job"})
         
         assert "enqueue" in str(exc_info.value).lower()
     
-    @patch("app.queue.redis.Redis.from_url")
-    def test_get_redis_client_success(self, mock_redis_from_url):
-        """Test successful Redis client creation."""
-        mock_client = MagicMock()
-        mock_client.ping.return_value = True
-        mock_redis_from_url.return_value = mock_client
+    def test_enqueue_jobs_batch(self, fake_redis):
+        """Test several jobs are enqueued in order in one call."""
+        messages = [{"job_id": f"job-{i}"} for i in range(3)]
         
-        # Reset global client
-        import app.queue
-        app.queue.redis_client = None
+        message_ids = enqueue_jobs(messages)
+        
+        entries = fake_redis.xrange(settings.REDIS_STREAM_KEY)
+        assert [entry_id for entry_id, _ in entries] == message_ids
+        assert [orjson.loads(fields[b"data"]) for _, fields in entries] == messages
+    
+    def test_enqueue_jobs_uses_one_pipeline(self, monkeypatch, mock_client):
+        """Test the batch goes through a single non-transactional pipeline."""
+        pipe = mock_client.pipeline.return_value.__enter__.return_value
+        pipe.execute.return_value = [b"1-0", b"1-1"]
+        monkeypatch.setattr("app.queue.get_redis_client", lambda: mock_client)
+        
+        enqueue_jobs([{"job_id": "job-0"}, {"job_id": "job-1"}])
+        
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.xadd.call_count == 2
+        pipe.execute.assert_called_once()
+    
+    def test_enqueue_jobs_redis_error(self, monkeypatch, mock_client):
+        """Test batch enqueue with Redis error."""
+        pipe = mock_client.pipeline.return_value.__enter__.return_value
+        pipe.execute.side_effect = RedisError("Redis error")
+        monkeypatch.setattr("app.queue.get_redis_client", lambda: mock_client)
+        
+        with pytest.raises(QueueError):
+            enqueue_jobs([{"job_id": "test-job"}])
+    
+    def test_enqueue_jobs_empty(self, monkeypatch):
+        """Test batch enqueue with no messages skips Redis entirely."""
+        mock_get_client = MagicMock()
+        monkeypatch.setattr("app.queue.get_redis_client", mock_get_client)
+        
+        assert enqueue_jobs([]) == []
+        mock_get_client.assert_not_called()
+    
+    def test_get_redis_client_success(self, mocker, mock_client):
+        """Test successful Redis client creation."""
+        mock_create_client = mocker.patch("app.queue._create_redis_client")
+        mock_create_client.return_value = mock_client
         
         client = get_redis_client()
         
-        assert client is not None
+        assert client is mock_client
+        assert app.queue.redis_client is mock_client
         mock_client.ping.assert_called_once()
     
-    @patch("app.queue.redis.Redis.from_url")
-    def test_get_redis_client_connection_error(self, mock_redis_from_url):
+    def test_get_redis_client_connection_error(self, mocker):
         """Test Redis client creation with connection error."""
-        mock_redis_from_url.side_effect = RedisConnectionError("Connection failed")
-        
-        # Reset global client
-        import app.queue
-        app.queue.redis_client = None
+        mock_create_client = mocker.patch("app.queue._create_redis_client")
+        mock_create_client.side_effect = RedisConnectionError("Connection failed")
         
         with pytest.raises(QueueError) as exc_info:
             get_redis_client()
         
         assert "connection" in str(exc_info.value).lower()
+        assert app.queue.redis_client is None
     
-    @patch("app.queue.redis.Redis.from_url")
-    def test_check_redis_connection_success(self, mock_redis_from_url):
+    def test_check_redis_connection_success(self, mocker, mock_client):
         """Test successful Redis connection check."""
-        mock_client = MagicMock()
-        mock_client.ping.return_value = True
-        mock_redis_from_url.return_value = mock_client
-        
-        # Reset global client
-        import app.queue
-        app.queue.redis_client = None
+        mock_create_client = mocker.patch("app.queue._create_redis_client")
+        mock_create_client.return_value = mock_client
         
         result = check_redis_connection()
         
         assert result is True
     
-    @patch("app.queue.redis.Redis.from_url")
-    def test_check_redis_connection_failure(self, mock_redis_from_url):
+    def test_check_redis_connection_failure(self, mocker):
         """Test Redis connection check failure."""
-        mock_redis_from_url.side_effect = Exception("Connection error")
-        
-        # Reset global client
-        import app.queue
-        app.queue.redis_client = None
+        mock_create_client = mocker.patch("app.queue._create_redis_client")
+        mock_create_client.side_effect = Exception("Connection error")
         
         result = check_redis_connection()
         
         assert result is False
     
-    @patch("app.queue.redis_client")
-    def test_check_redis_connection_existing_client(self, mock_redis_client):
+    def test_check_redis_connection_existing_client(self, fake_redis):
         """Test Redis connection check with existing client."""
-        mock_redis_client.ping.return_value = True
-        
         result = check_redis_connection()
         
         assert result is True
-        mock_redis_client.ping.assert_called_once()
-
+        assert app.queue.redis_client is fake_redis
+    
+    def test_check_redis_connection_cached(self, monkeypatch, mock_client):
+        """Test a second check within the TTL reuses the first result."""
+        monkeypatch.setattr("app.queue.redis_client", mock_client)
+        
+        assert check_redis_connection() is True
+        assert check_redis_connection() is True
+        
+        mock_client.ping.assert_called_once()
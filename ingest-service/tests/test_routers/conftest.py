@@ -0,0 +1,50 @@
+"""
+Shared fixtures for router tests.
+"""
+import pytest
+
+from app.auth import get_current_user
+from app.constants import Role
+from app.main import app
+from app.routers import auth as auth_router
+
+
+@pytest.fixture(scope="package", autouse=True)
+def fast_password_hashing():
+    """
+    Replace bcrypt in the login flow with a plaintext stand-in.
+    
+    Router tests exercise request handling, not the KDF (covered in
+    test_auth.py), so demo users are "hashed" as ``hashed:<password>``.
+    The demo user cache is cleared on both sides so no stub hash outlives
+    the package.
+    """
+    async def verify(plain_password: str, hashed_password: str) -> bool:
+        return hashed_password == f"hashed:{plain_password}"
+    
+    auth_router._DEMO_USERS_CACHE.clear()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth_router, "get_password_hash", lambda password: f"hashed:{password}")
+        mp.setattr(auth_router, "averify_password", verify)
+        yield
+    auth_router._DEMO_USERS_CACHE.clear()
+
+
+@pytest.fixture
+def current_user(client):
+    """
+    Authenticate requests as a fixed user without a bearer token.
+    
+    For tests about request validation or service errors rather than auth;
+    the override is a plain dict lookup instead of a JWT decode.
+    """
+    user = {
+        "user_id": "test-user-001",
+        "username": "testuser",
+        "email": "testuser@test.com",
+        "roles": Role.USER.to_names(),
+        "permissions": [],
+    }
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield user
+    app.dependency_overrides.pop(get_current_user, None)
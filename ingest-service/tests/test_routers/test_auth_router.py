@@ -1,9 +1,6 @@
 """
 Tests for auth router.
 """
-import pytest
-from unittest.mock import patch
-
 from app.auth import create_test_token
 
 
@@ -2,15 +2,30 @@
 Tests for health router.
 """
 import pytest
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
+
+
+@pytest.fixture
+def health_checks():
+    """Patch all readiness dependency checks, healthy unless a test says otherwise."""
+    with patch.multiple(
+        "app.routers.health",
+        check_db_connection=DEFAULT,
+        check_redis_connection=DEFAULT,
+        check_storage_connection=DEFAULT,
+    ) as mocks:
+        for mock in mocks.values():
+            mock.return_value = True
+        yield mocks
 
 
 class TestHealthRouter:
     """Test cases for health router."""
     
-    def test_health_check(self, client):
+    @pytest.mark.asyncio
+    async def test_health_check(self, async_client):
         """Test basic health check."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         
         assert response.status_code == 200
         data = response.json()
@@ -18,105 +33,38 @@ class TestHealthRouter:
         assert "service" in data
         assert "version" in data
     
-    @patch("app.routers.health.check_db_connection")
-    @patch("app.routers.health.check_redis_connection")
-    @patch("app.routers.health.check_storage_connection")
-    def test_readiness_check_all_healthy(
-        self,
-        mock_storage,
-        mock_redis,
-        mock_db,
-        client,
-    ):
-        """Test readiness check when all services are healthy."""
-        mock_db.return_value = True
-        mock_redis.return_value = True
-        mock_storage.return_value = True
-        
-        response = client.get("/health/ready")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ready"
-        assert data["components"]["database"] == "healthy"
-        assert data["components"]["redis"] == "healthy"
-        assert data["components"]["storage"] == "healthy"
-    
-    @patch("app.routers.health.check_db_connection")
-    @patch("app.routers.health.check_redis_connection")
-    @patch("app.routers.health.check_storage_connection")
-    def test_readiness_check_db_unhealthy(
-        self,
-        mock_storage,
-        mock_redis,
-        mock_db,
-        client,
-    ):
-        """Test readiness check when database is unhealthy."""
-        mock_db.return_value = False
-        mock_redis.return_value = True
-        mock_storage.return_value = True
-        
-        response = client.get("/health/ready")
-        
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "not_ready"
-        assert data["components"]["database"] == "unhealthy"
-        assert data["components"]["redis"] == "healthy"
-        assert data["components"]["storage"] == "healthy"
-    
-    @patch("app.routers.health.check_db_connection")
-    @patch("app.routers.health.check_redis_connection")
-    @patch("app.routers.health.check_storage_connection")
-    def test_readiness_check_redis_unhealthy(
-        self,
-        mock_storage,
-        mock_redis,
-        mock_db,
-        client,
-    ):
-        """Test readiness check when Redis is unhealthy."""
-        mock_db.return_value = True
-        mock_redis.return_value = False
-        mock_storage.return_value = True
-        
-        response = client.get("/health/ready")
-        
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "not_ready"
-        assert data["components"]["database"] == "healthy"
-        assert data["components"]["redis"] == "unhealthy"
-        assert data["components"]["storage"] == "healthy"
-    
-    @patch("app.routers.health.check_db_connection")
-    @patch("app.routers.health.check_redis_connection")
-    @patch("app.routers.health.check_storage_connection")
-    def test_readiness_check_storage_unhealthy(
-        self,
-        mock_storage,
-        mock_redis,
-        mock_db,
-        client,
-    ):
-        """Test readiness check when storage is unhealthy."""
-        mock_db.return_value = True
-        mock_redis.return_value = True
-        mock_storage.return_value = False
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "unhealthy",
+        [None, "database", "redis", "storage"],
+    )
+    async def test_readiness_check(self, async_client, health_checks, unhealthy):
+        """Test readiness check with all services healthy or one down."""
+        checks = {
+            "database": "check_db_connection",
+            "redis": "check_redis_connection",
+            "storage": "check_storage_connection",
+        }
+        if unhealthy:
+            health_checks[checks[unhealthy]].return_value = False
         
-        response = client.get("/health/ready")
+        response = await async_client.get("/health/ready")
         
-        assert response.status_code == 503
         data = response.json()
-        assert data["status"] == "not_ready"
-        assert data["components"]["database"] == "healthy"
-        assert data["components"]["redis"] == "healthy"
-        assert data["components"]["storage"] == "unhealthy"
+        if unhealthy:
+            assert response.status_code == 503
+            assert data["status"] == "not_ready"
+        else:
+            assert response.status_code == 200
+            assert data["status"] == "ready"
+        for component in checks:
+            expected = "unhealthy" if component == unhealthy else "healthy"
+            assert data["components"][component] == expected
     
-    def test_liveness_check(self, client):
+    @pytest.mark.asyncio
+    async def test_liveness_check(self, async_client):
         """Test liveness check."""
-        response = client.get("/health/live")
+        response = await async_client.get("/health/live")
         
         assert response.status_code == 200
         data = response.json()
@@ -1,32 +1,27 @@
 """
 Tests for ingest router.
 """
-import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
-from app.models import Job, FileUpload
 from app.constants import JobStatus, JobType
+from app.exceptions import InvalidJobStateError, JobNotFoundError, StorageError
 
 
 class TestIngestRouter:
     """Test cases for ingest router."""
     
-    @patch("app.routers.ingest.UploadService.init_upload")
-    def test_init_upload_success(self, mock_init, client, auth_headers):
+    def test_init_upload_success(self, mocker, client, auth_headers):
         """Test successful upload initialization."""
-        from app.models import Job, FileUpload
-        from app.constants import JobStatus, JobType
-        
-        # Create mock return values
-        mock_job = MagicMock(spec=Job)
-        mock_job.job_id = "test-job-id"
-        mock_job.job_type = JobType.FILE_UPLOAD.value
-        mock_job.status = JobStatus.CREATED.value
-        
-        mock_upload = MagicMock(spec=FileUpload)
-        mock_upload.job_id = "test-job-id"
+        mock_init = mocker.patch("app.routers.ingest.UploadService.init_upload")
+        # Plain attribute holders are enough for what the router reads
+        job = SimpleNamespace(
+            job_id="test-job-id",
+            job_type=JobType.FILE_UPLOAD.value,
+            status=JobStatus.CREATED.value,
+        )
+        upload = SimpleNamespace(job_id="test-job-id")
         
-        mock_init.return_value = (mock_job, mock_upload, "https://test-presigned-url.com")
+        mock_init.return_value = (job, upload, "https://test-presigned-url.com")
         
         response = client.post(
             "/ingest/files/init",
@@ -73,7 +68,7 @@ class TestIngestRouter:
         
         assert response.status_code == 403
     
-    def test_init_upload_missing_fields(self, client):
+    def test_init_upload_missing_fields(self, client, current_user):
         """Test upload initialization with missing fields."""
         response = client.post(
             "/ingest/files/init",
@@ -84,7 +79,7 @@ class TestIngestRouter:
         
         assert response.status_code == 422
     
-    def test_init_upload_invalid_size(self, client):
+    def test_init_upload_invalid_size(self, client, current_user):
         """Test upload initialization with invalid size."""
         response = client.post(
             "/ingest/files/init",
@@ -97,11 +92,9 @@ class TestIngestRouter:
         
         assert response.status_code == 422
     
-    @patch("app.routers.ingest.UploadService.init_upload")
-    def test_init_upload_storage_error(self, mock_init, client):
+    def test_init_upload_storage_error(self, mocker, client, current_user):
         """Test upload initialization with storage error."""
-        from app.exceptions import StorageError
-        
+        mock_init = mocker.patch("app.routers.ingest.UploadService.init_upload")
         mock_init.side_effect = StorageError("Storage unavailable")
         
         response = client.post(
@@ -116,9 +109,9 @@ class TestIngestRouter:
         assert response.status_code == 503
         assert "Storage" in response.json()["detail"]
     
-    @patch("app.routers.ingest.UploadService.complete_upload")
-    def test_complete_upload_success(self, mock_complete, client, sample_job, auth_headers):
+    def test_complete_upload_success(self, mocker, client, sample_job, auth_headers):
         """Test successful upload completion."""
+        mock_complete = mocker.patch("app.routers.ingest.UploadService.complete_upload")
         mock_complete.return_value = sample_job
         
         response = client.post(
@@ -135,7 +128,35 @@ class TestIngestRouter:
         assert data["message"] == "Job queued successfully"
         assert "job_id" in data
     
-    def test_complete_upload_missing_job_id(self, client):
+    def test_complete_uploads_success(self, mocker, client, sample_job, auth_headers):
+        """Test successful batch upload completion."""
+        mock_complete = mocker.patch("app.routers.ingest.UploadService.complete_uploads")
+        mock_complete.return_value = [sample_job]
+        
+        response = client.post(
+            "/ingest/files/complete/batch",
+            json={
+                "job_ids": [sample_job.job_id],
+            },
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] == "Jobs queued successfully"
+        assert data["jobs"][0]["job_id"] == sample_job.job_id
+    
+    def test_complete_uploads_empty_job_ids(self, client, auth_headers):
+        """Test batch upload completion with no job IDs."""
+        response = client.post(
+            "/ingest/files/complete/batch",
+            json={"job_ids": []},
+            headers=auth_headers,
+        )
+        
+        assert response.status_code == 422
+    
+    def test_complete_upload_missing_job_id(self, client, current_user):
         """Test completing upload with missing job_id."""
         response = client.post(
             "/ingest/files/complete",
@@ -144,11 +165,9 @@ class TestIngestRouter:
         
         assert response.status_code == 422
     
-    @patch("app.routers.ingest.UploadService.complete_upload")
-    def test_complete_upload_job_not_found(self, mock_complete, client):
+    def test_complete_upload_job_not_found(self, mocker, client, current_user):
         """Test completing upload with non-existent job."""
-        from app.exceptions import JobNotFoundError
-        
+        mock_complete = mocker.patch("app.routers.ingest.UploadService.complete_upload")
         mock_complete.side_effect = JobNotFoundError("Job not found")
         
         response = client.post(
@@ -161,11 +180,9 @@ class TestIngestRouter:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    @patch("app.routers.ingest.UploadService.complete_upload")
-    def test_complete_upload_invalid_state(self, mock_complete, client):
+    def test_complete_upload_invalid_state(self, mocker, client, current_user):
         """Test completing upload with invalid job state."""
-        from app.exceptions import InvalidJobStateError
-        
+        mock_complete = mocker.patch("app.routers.ingest.UploadService.complete_upload")
         mock_complete.side_effect = InvalidJobStateError("Invalid state")
         
         response = client.post(
@@ -178,11 +195,9 @@ class TestIngestRouter:
         assert response.status_code == 400
         assert "state" in response.json()["detail"].lower()
     
-    @patch("app.routers.ingest.UploadService.complete_upload")
-    def test_complete_upload_storage_error(self, mock_complete, client):
+    def test_complete_upload_storage_error(self, mocker, client, current_user):
         """Test completing upload with storage error."""
-        from app.exceptions import StorageError
-        
+        mock_complete = mocker.patch("app.routers.ingest.UploadService.complete_upload")
         mock_complete.side_effect = StorageError("File not found")
         
         response = client.post(
@@ -1,12 +1,30 @@
 """
 Tests for jobs router.
 """
-import pytest
+from sqlalchemy import insert
 
 from app.models import Job
 from app.constants import JobStatus, JobType
 
 
+def _insert_jobs(db_session, rows):
+    """Insert job rows with a single executemany INSERT."""
+    db_session.execute(
+        insert(Job),
+        [
+            {
+                "job_type": JobType.FILE_UPLOAD.value,
+                "source": "test",
+                "status": JobStatus.CREATED.value,
+                "progress": 0,
+                **row,
+            }
+            for row in rows
+        ],
+    )
+    db_session.commit()
+
+
 class TestJobsRouter:
     """Test cases for jobs router."""
     
@@ -52,18 +70,7 @@ class TestJobsRouter:
     def test_list_jobs_with_data(self, client, db_session, auth_headers):
         """Test listing jobs with data."""
         # Create multiple jobs
-        jobs = []
-        for i in range(5):
-            job = Job(
-                job_id=f"job-{i}",
-                job_type=JobType.FILE_UPLOAD.value,
-                source="test",
-                status=JobStatus.CREATED.value,
-                progress=0,
-            )
-            db_session.add(job)
-            jobs.append(job)
-        db_session.commit()
+        _insert_jobs(db_session, [{"job_id": f"job-{i}"} for i in range(5)])
         
         response = client.get("/jobs", headers=auth_headers)
         
@@ -77,16 +84,7 @@ class TestJobsRouter:
     def test_list_jobs_with_limit(self, client, db_session, auth_headers):
         """Test listing jobs with limit."""
         # Create 10 jobs
-        for i in range(10):
-            job = Job(
-                job_id=f"job-{i}",
-                job_type=JobType.FILE_UPLOAD.value,
-                source="test",
-                status=JobStatus.CREATED.value,
-                progress=0,
-            )
-            db_session.add(job)
-        db_session.commit()
+        _insert_jobs(db_session, [{"job_id": f"job-{i}"} for i in range(10)])
         
         response = client.get("/jobs?limit=5", headers=auth_headers)
         
@@ -97,16 +95,7 @@ class TestJobsRouter:
     def test_list_jobs_with_offset(self, client, db_session, auth_headers):
         """Test listing jobs with offset."""
         # Create 5 jobs
-        for i in range(5):
-            job = Job(
-                job_id=f"job-{i}",
-                job_type=JobType.FILE_UPLOAD.value,
-                source="test",
-                status=JobStatus.CREATED.value,
-                progress=0,
-            )
-            db_session.add(job)
-        db_session.commit()
+        _insert_jobs(db_session, [{"job_id": f"job-{i}"} for i in range(5)])
         
         response = client.get("/jobs?limit=2&offset=2", headers=auth_headers)
         
@@ -117,16 +106,10 @@ class TestJobsRouter:
     def test_list_jobs_with_status_filter(self, client, db_session, auth_headers):
         """Test listing jobs with status filter."""
         # Create jobs with different statuses
-        for status in [JobStatus.CREATED, JobStatus.QUEUED, JobStatus.PROCESSING]:
-            job = Job(
-                job_id=f"job-{status.value}",
-                job_type=JobType.FILE_UPLOAD.value,
-                source="test",
-                status=status.value,
-                progress=0,
-            )
-            db_session.add(job)
-        db_session.commit()
+        _insert_jobs(db_session, [
+            {"job_id": f"job-{status.value}", "status": status.value}
+            for status in [JobStatus.CREATED, JobStatus.QUEUED, JobStatus.PROCESSING]
+        ])
         
         response = client.get("/jobs?status=CREATED", headers=auth_headers)
         
@@ -138,16 +121,10 @@ class TestJobsRouter:
     def test_list_jobs_with_job_type_filter(self, client, db_session, auth_headers):
         """Test listing jobs with job type filter."""
         # Create jobs with different types
-        for job_type in [JobType.FILE_UPLOAD, JobType.STREAM_INGEST]:
-            job = Job(
-                job_id=f"job-{job_type.value}",
-                job_type=job_type.value,
-                source="test",
-                status=JobStatus.CREATED.value,
-                progress=0,
-            )
-            db_session.add(job)
-        db_session.commit()
+        _insert_jobs(db_session, [
+            {"job_id": f"job-{job_type.value}", "job_type": job_type.value}
+            for job_type in [JobType.FILE_UPLOAD, JobType.STREAM_INGEST]
+        ])
         
         response = client.get("/jobs?job_type=FILE_UPLOAD", headers=auth_headers)
         
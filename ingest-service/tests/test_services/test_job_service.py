@@ -1,14 +1,22 @@
 """
 Tests for JobService.
 """
+import time
+import uuid
 import pytest
-from datetime import datetime, timezone
 
 from app.services.job_service import JobService
-from app.models import Job, FileUpload
 from app.constants import JobStatus, JobType, StorageType, LogFormat
 from app.exceptions import JobNotFoundError, InvalidJobStateError
 
+# Plain string values used in assertions, bound once per module
+CREATED = JobStatus.CREATED.value
+QUEUED = JobStatus.QUEUED.value
+FAILED = JobStatus.FAILED.value
+FILE_UPLOAD = JobType.FILE_UPLOAD.value
+JSON_FORMAT = LogFormat.JSON.value
+S3_STORAGE = StorageType.S3.value
+
 
 class TestJobService:
     """Test cases for JobService."""
@@ -24,20 +32,29 @@ class TestJobService:
         
         assert job is not None
         assert job.job_id is not None
-        assert job.job_type == JobType.FILE_UPLOAD.value
+        assert uuid.UUID(job.job_id).version == 7
+        assert job.job_type == FILE_UPLOAD
         assert job.source == "test"
-        assert job.status == JobStatus.CREATED.value
+        assert job.status == CREATED
         assert job.progress == 0
         assert job.retry_count == 0
         assert job.created_at is not None
     
+    def test_job_ids_are_time_ordered(self, db_session):
+        """Test that generated job IDs sort by creation order."""
+        first = JobService.create_job(db=db_session, job_type=JobType.FILE_UPLOAD)
+        time.sleep(0.002)
+        second = JobService.create_job(db=db_session, job_type=JobType.FILE_UPLOAD)
+        
+        assert first.job_id < second.job_id
+    
     def test_get_job(self, db_session, sample_job):
         """Test getting a job by ID."""
         job = JobService.get_job(db_session, sample_job.job_id)
         
         assert job is not None
         assert job.job_id == sample_job.job_id
-        assert job.status == JobStatus.CREATED.value
+        assert job.status == CREATED
     
     def test_get_job_not_found(self, db_session):
         """Test getting a non-existent job."""
@@ -57,38 +74,24 @@ class TestJobService:
         with pytest.raises(JobNotFoundError):
             JobService.get_job_or_raise(db_session, "non-existent-id")
     
-    def test_update_job_status_to_queued(self, db_session, sample_job):
-        """Test updating job status to QUEUED."""
-        job = JobService.update_job_status(
-            db_session,
-            sample_job,
-            JobStatus.QUEUED,
-        )
-        
-        assert job.status == JobStatus.QUEUED.value
-        assert job.queued_at is not None
-    
-    def test_update_job_status_to_processing(self, db_session, sample_job):
-        """Test updating job status to PROCESSING."""
+    @pytest.mark.parametrize(
+        "status,timestamp_field",
+        [
+            (JobStatus.QUEUED, "queued_at"),
+            (JobStatus.PROCESSING, "started_at"),
+            (JobStatus.COMPLETED, "finished_at"),
+        ],
+    )
+    def test_update_job_status(self, db_session, sample_job, status, timestamp_field):
+        """Test updating job status sets the matching timestamp."""
         job = JobService.update_job_status(
             db_session,
             sample_job,
-            JobStatus.PROCESSING,
+            status,
         )
         
-        assert job.status == JobStatus.PROCESSING.value
-        assert job.started_at is not None
-    
-    def test_update_job_status_to_completed(self, db_session, sample_job):
-        """Test updating job status to COMPLETED."""
-        job = JobService.update_job_status(
-            db_session,
-            sample_job,
-            JobStatus.COMPLETED,
-        )
-        
-        assert job.status == JobStatus.COMPLETED.value
-        assert job.finished_at is not None
+        assert job.status == status.value
+        assert getattr(job, timestamp_field) is not None
     
     def test_update_job_status_with_error(self, db_session, sample_job):
         """Test updating job status with error message."""
@@ -100,10 +103,25 @@ class TestJobService:
             error_message=error_msg,
         )
         
-        assert job.status == JobStatus.FAILED.value
+        assert job.status == FAILED
         assert job.error_message == error_msg
         assert job.finished_at is not None
     
+    def test_update_jobs_status(self, db_session, sample_job):
+        """Test updating several jobs' status with one statement."""
+        other = JobService.create_job(db=db_session, job_type=JobType.FILE_UPLOAD)
+        
+        updated = JobService.update_jobs_status(
+            db_session,
+            [sample_job.job_id, other.job_id],
+            JobStatus.QUEUED,
+        )
+        
+        assert updated == 2
+        for job in (sample_job, other):
+            assert job.status == QUEUED
+            assert job.queued_at is not None
+    
     def test_validate_job_state_success(self, sample_job):
         """Test validating job state with correct state."""
         # Should not raise exception
@@ -133,8 +151,8 @@ class TestJobService:
         assert upload.bucket == "test-bucket"
         assert upload.object_key == "test-key.log"
         assert upload.file_size == 2048
-        assert upload.log_format == LogFormat.JSON.value
-        assert upload.storage_type == StorageType.S3.value
+        assert upload.log_format == JSON_FORMAT
+        assert upload.storage_type == S3_STORAGE
     
     def test_get_file_upload(self, db_session, sample_file_upload):
         """Test getting file upload by job ID."""
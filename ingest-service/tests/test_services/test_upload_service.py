@@ -1,22 +1,51 @@
 """
 Tests for UploadService.
 """
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import patch, MagicMock
+from sqlalchemy import func, select
 
-from app.services.upload_service import UploadService
-from app.models import Job, FileUpload
+from app.services.job_service import JobService
+from app.services.upload_service import UploadService, MAX_FILE_EXTENSION_LENGTH
+from app.models import Job
 from app.constants import JobStatus, JobType, LogFormat
 from app.exceptions import JobNotFoundError, InvalidJobStateError, StorageError
 
+# Plain string values used in assertions, bound once per module
+CREATED = JobStatus.CREATED.value
+QUEUED = JobStatus.QUEUED.value
+FILE_UPLOAD = JobType.FILE_UPLOAD.value
+JSON_FORMAT = LogFormat.JSON.value
+
+
+@pytest.fixture(autouse=True)
+def storage_and_queue(mocker):
+    """
+    Stub the object existence check and enqueue used by complete_upload.
+    
+    Every test gets a file that exists and a queue that accepts the job;
+    failure cases set ``return_value``/``side_effect`` on the stubs.
+    """
+    return SimpleNamespace(
+        object_exists=mocker.patch(
+            "app.services.upload_service.object_exists", return_value=True
+        ),
+        enqueue_job=mocker.patch(
+            "app.services.upload_service.enqueue_job", return_value="test-message-id"
+        ),
+    )
+
 
 class TestUploadService:
     """Test cases for UploadService."""
     
-    @patch("app.services.upload_service.generate_presigned_put")
-    def test_init_upload_success(self, mock_presigned, db_session):
+    def test_init_upload_success(self, mocker, db_session):
         """Test successful upload initialization."""
-        mock_presigned.return_value = "https://test-presigned-url.com"
+        mock_presigned = mocker.patch(
+            "app.services.upload_service.generate_presigned_put",
+            return_value="https://test-presigned-url.com",
+        )
         
         job, upload, presigned_url = UploadService.init_upload(
             db=db_session,
@@ -26,21 +55,23 @@ class TestUploadService:
         )
         
         assert job is not None
-        assert job.job_type == JobType.FILE_UPLOAD.value
-        assert job.status == JobStatus.CREATED.value
+        assert job.job_type == FILE_UPLOAD
+        assert job.status == CREATED
         
         assert upload is not None
         assert upload.job_id == job.job_id
         assert upload.file_size == 1024
-        assert upload.log_format == LogFormat.JSON.value
+        assert upload.log_format == JSON_FORMAT
         
         assert presigned_url == "https://test-presigned-url.com"
         mock_presigned.assert_called_once()
     
-    @patch("app.services.upload_service.generate_presigned_put")
-    def test_init_upload_with_invalid_format(self, mock_presigned, db_session):
+    def test_init_upload_with_invalid_format(self, mocker, db_session):
         """Test upload initialization with invalid log format."""
-        mock_presigned.return_value = "https://test-presigned-url.com"
+        mocker.patch(
+            "app.services.upload_service.generate_presigned_put",
+            return_value="https://test-presigned-url.com",
+        )
         
         job, upload, presigned_url = UploadService.init_upload(
             db=db_session,
@@ -50,12 +81,40 @@ class TestUploadService:
         )
         
         # Should default to JSON
-        assert upload.log_format == LogFormat.JSON.value
+        assert upload.log_format == JSON_FORMAT
     
-    @patch("app.services.upload_service.generate_presigned_put")
-    def test_init_upload_storage_error(self, mock_presigned, db_session):
+    @pytest.mark.parametrize(
+        "filename,expected_suffix",
+        [
+            ("app.2024.01.01.ndjson", ".ndjson"),
+            ("noextension", ".log"),
+            ("trailingdot.", ".log"),
+            ("huge." + "x" * 100, "." + "x" * MAX_FILE_EXTENSION_LENGTH),
+        ],
+    )
+    def test_init_upload_object_key_extension(
+        self, mocker, db_session, filename, expected_suffix
+    ):
+        """Test object key extension derivation from the filename."""
+        mocker.patch(
+            "app.services.upload_service.generate_presigned_put",
+            return_value="https://test-presigned-url.com",
+        )
+        
+        job, upload, _ = UploadService.init_upload(
+            db=db_session,
+            filename=filename,
+            size=1024,
+        )
+        
+        assert upload.object_key == f"raw-logs/{job.job_id}{expected_suffix}"
+    
+    def test_init_upload_storage_error(self, mocker, db_session):
         """Test upload initialization with storage error."""
-        mock_presigned.side_effect = StorageError("Storage error")
+        mocker.patch(
+            "app.services.upload_service.generate_presigned_put",
+            side_effect=StorageError("Storage error"),
+        )
         
         with pytest.raises(StorageError):
             UploadService.init_upload(
@@ -65,32 +124,25 @@ class TestUploadService:
             )
         
         # Verify job was not committed
-        jobs = db_session.query(Job).all()
-        assert len(jobs) == 0
+        assert db_session.scalar(select(func.count()).select_from(Job)) == 0
     
-    @patch("app.services.upload_service.object_exists")
-    @patch("app.services.upload_service.enqueue_job")
     def test_complete_upload_success(
         self,
-        mock_enqueue,
-        mock_object_exists,
+        storage_and_queue,
         db_session,
         sample_job,
         sample_file_upload,
     ):
         """Test successful upload completion."""
-        mock_object_exists.return_value = True
-        mock_enqueue.return_value = "test-message-id"
-        
         job = UploadService.complete_upload(
             db=db_session,
             job_id=sample_job.job_id,
         )
         
-        assert job.status == JobStatus.QUEUED.value
+        assert job.status == QUEUED
         assert job.queued_at is not None
-        mock_object_exists.assert_called_once_with(sample_file_upload.object_key)
-        mock_enqueue.assert_called_once()
+        storage_and_queue.object_exists.assert_called_once_with(sample_file_upload.object_key)
+        storage_and_queue.enqueue_job.assert_called_once()
     
     def test_complete_upload_job_not_found(self, db_session):
         """Test completing upload with non-existent job."""
@@ -102,8 +154,6 @@ class TestUploadService:
     
     def test_complete_upload_invalid_state(self, db_session, sample_job):
         """Test completing upload with invalid job state."""
-        from app.services.job_service import JobService
-        
         # Change job status to QUEUED
         JobService.update_job_status(
             db_session,
@@ -118,16 +168,15 @@ class TestUploadService:
                 job_id=sample_job.job_id,
             )
     
-    @patch("app.services.upload_service.object_exists")
     def test_complete_upload_file_not_found(
         self,
-        mock_object_exists,
+        storage_and_queue,
         db_session,
         sample_job,
         sample_file_upload,
     ):
         """Test completing upload when file doesn't exist."""
-        mock_object_exists.return_value = False
+        storage_and_queue.object_exists.return_value = False
         
         with pytest.raises(StorageError) as exc_info:
             UploadService.complete_upload(
@@ -137,19 +186,15 @@ class TestUploadService:
         
         assert "not found" in str(exc_info.value).lower()
     
-    @patch("app.services.upload_service.object_exists")
-    @patch("app.services.upload_service.enqueue_job")
     def test_complete_upload_enqueue_failure(
         self,
-        mock_enqueue,
-        mock_object_exists,
+        storage_and_queue,
         db_session,
         sample_job,
         sample_file_upload,
     ):
         """Test completing upload when enqueue fails."""
-        mock_object_exists.return_value = True
-        mock_enqueue.side_effect = Exception("Queue error")
+        storage_and_queue.enqueue_job.side_effect = Exception("Queue error")
         
         with pytest.raises(Exception):
             UploadService.complete_upload(
@@ -158,6 +203,66 @@ class TestUploadService:
             )
         
         # Verify job status was rolled back
-        db_session.refresh(sample_job)
-        assert sample_job.status == JobStatus.CREATED.value
-
+        db_session.expire(sample_job, ["status"])
+        assert sample_job.status == CREATED
+    
+    def test_complete_uploads_success(
+        self,
+        mocker,
+        db_session,
+        sample_job,
+        sample_file_upload,
+    ):
+        """Test completing several uploads at once."""
+        mock_find_existing = mocker.patch(
+            "app.services.upload_service.find_existing_objects",
+            return_value={sample_file_upload.object_key},
+        )
+        mock_enqueue = mocker.patch(
+            "app.services.upload_service.enqueue_jobs",
+            return_value=["test-message-id"],
+        )
+        
+        jobs = UploadService.complete_uploads(
+            db=db_session,
+            job_ids=[sample_job.job_id, sample_job.job_id],
+        )
+        
+        assert [job.job_id for job in jobs] == [sample_job.job_id]
+        assert jobs[0].status == QUEUED
+        assert jobs[0].queued_at is not None
+        mock_find_existing.assert_called_once()
+        mock_enqueue.assert_called_once()
+        assert len(mock_enqueue.call_args[0][0]) == 1
+    
+    def test_complete_uploads_job_not_found(self, db_session, sample_job):
+        """Test completing several uploads when one job doesn't exist."""
+        with pytest.raises(JobNotFoundError):
+            UploadService.complete_uploads(
+                db=db_session,
+                job_ids=[sample_job.job_id, "non-existent-id"],
+            )
+    
+    def test_complete_uploads_file_not_found(
+        self,
+        mocker,
+        db_session,
+        sample_job,
+        sample_file_upload,
+    ):
+        """Test completing several uploads when a file is missing."""
+        mocker.patch(
+            "app.services.upload_service.find_existing_objects",
+            return_value=set(),
+        )
+        mock_enqueue = mocker.patch("app.services.upload_service.enqueue_jobs")
+        
+        with pytest.raises(StorageError) as exc_info:
+            UploadService.complete_uploads(
+                db=db_session,
+                job_ids=[sample_job.job_id],
+            )
+        
+        assert "not found" in str(exc_info.value).lower()
+        assert sample_job.status == CREATED
+        mock_enqueue.assert_not_called()
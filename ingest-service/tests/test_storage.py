@@ -2,69 +2,72 @@
 Tests for storage module.
 """
 import pytest
-from unittest.mock import patch, MagicMock
 from botocore.exceptions import ClientError, BotoCoreError
 
 from app.storage import (
     generate_presigned_put,
     object_exists,
+    find_existing_objects,
     get_object_size,
     check_storage_connection,
 )
+from app.config import settings
 from app.exceptions import StorageError
 
+# botocore error responses shared by the ClientError cases
+ACCESS_DENIED = {"Error": {"Code": "AccessDenied", "Message": "Access denied"}}
+NOT_FOUND = {"Error": {"Code": "404", "Message": "Not Found"}}
+INTERNAL_ERROR = {"Error": {"Code": "500", "Message": "Internal Error"}}
+
 
 class TestStorage:
     """Test cases for storage module."""
     
-    @patch("app.storage.s3_client")
-    def test_generate_presigned_put_success(self, mock_s3_client):
+    def test_generate_presigned_put_success(self, mock_s3):
         """Test successful presigned URL generation."""
-        mock_s3_client.generate_presigned_url.return_value = "https://test-url.com"
+        mock_s3.generate_presigned_url.return_value = "https://test-url.com"
         
         url = generate_presigned_put("test-key", expires=3600)
         
         assert url == "https://test-url.com"
-        mock_s3_client.generate_presigned_url.assert_called_once()
+        mock_s3.generate_presigned_url.assert_called_once()
     
-    @patch("app.storage.s3_client")
-    def test_generate_presigned_put_client_error(self, mock_s3_client):
-        """Test presigned URL generation with client error."""
-        error_response = {"Error": {"Code": "AccessDenied", "Message": "Access denied"}}
-        mock_s3_client.generate_presigned_url.side_effect = ClientError(
-            error_response,
-            "GeneratePresignedUrl",
-        )
+    @pytest.mark.parametrize(
+        "error,expected_message",
+        [
+            (
+                ClientError(
+                    ACCESS_DENIED,
+                    "GeneratePresignedUrl",
+                ),
+                "Failed to generate presigned URL: AccessDenied",
+            ),
+            (BotoCoreError(), "Storage service error"),
+        ],
+        ids=["client_error", "boto_error"],
+    )
+    def test_generate_presigned_put_error(self, mock_s3, error, expected_message):
+        """Test presigned URL generation with S3 errors."""
+        mock_s3.generate_presigned_url.side_effect = error
         
         with pytest.raises(StorageError) as exc_info:
             generate_presigned_put("test-key")
         
-        assert "AccessDenied" in str(exc_info.value)
+        assert expected_message in str(exc_info.value)
     
-    @patch("app.storage.s3_client")
-    def test_generate_presigned_put_boto_error(self, mock_s3_client):
-        """Test presigned URL generation with boto error."""
-        mock_s3_client.generate_presigned_url.side_effect = BotoCoreError()
-        
-        with pytest.raises(StorageError):
-            generate_presigned_put("test-key")
-    
-    @patch("app.storage.s3_client")
-    def test_object_exists_true(self, mock_s3_client):
+    def test_object_exists_true(self, mock_s3):
         """Test object exists check when object exists."""
-        mock_s3_client.head_object.return_value = {}
+        mock_s3.head_object.return_value = {}
         
         result = object_exists("test-key")
         
         assert result is True
-        mock_s3_client.head_object.assert_called_once()
+        mock_s3.head_object.assert_called_once()
     
-    @patch("app.storage.s3_client")
-    def test_object_exists_false(self, mock_s3_client):
+    def test_object_exists_false(self, mock_s3):
         """Test object exists check when object doesn't exist."""
-        error_response = {"Error": {"Code": "404", "Message": "Not Found"}}
-        mock_s3_client.head_object.side_effect = ClientError(
-            error_response,
+        mock_s3.head_object.side_effect = ClientError(
+            NOT_FOUND,
             "HeadObject",
         )
         
@@ -72,33 +75,108 @@ class TestStorage:
         
         assert result is False
     
-    @patch("app.storage.s3_client")
-    def test_object_exists_error(self, mock_s3_client):
+    def test_object_exists_error(self, mock_s3):
         """Test object exists check with error."""
-        error_response = {"Error": {"Code": "500", "Message": "Internal Error"}}
-        mock_s3_client.head_object.side_effect = ClientError(
-            error_response,
+        mock_s3.head_object.side_effect = ClientError(
+            INTERNAL_ERROR,
             "HeadObject",
         )
         
         with pytest.raises(StorageError):
             object_exists("test-key")
     
-    @patch("app.storage.s3_client")
-    def test_get_object_size_success(self, mock_s3_client):
+    def test_find_existing_objects(self, mock_s3):
+        """Test finding existing objects across paginated listings."""
+        mock_s3.list_objects_v2.side_effect = [
+            {
+                "Contents": [{"Key": "raw-logs/job-1.log"}, {"Key": "raw-logs/job-10.log"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token-1",
+            },
+            {
+                "Contents": [{"Key": "raw-logs/job-2.log"}],
+                "IsTruncated": False,
+            },
+        ]
+        
+        found = find_existing_objects(
+            ["raw-logs/job-1.log", "raw-logs/job-2.log", "raw-logs/job-3.log"]
+        )
+        
+        assert found == {"raw-logs/job-1.log", "raw-logs/job-2.log"}
+        assert mock_s3.list_objects_v2.call_count == 2
+        first_call = mock_s3.list_objects_v2.call_args_list[0].kwargs
+        assert first_call["Prefix"] == "raw-logs/job-"
+        assert first_call["StartAfter"] == "raw-logs/job-1.lo"
+        assert mock_s3.list_objects_v2.call_args_list[1].kwargs["ContinuationToken"] == "token-1"
+    
+    def test_find_existing_objects_stops_past_last_key(self, mock_s3):
+        """Test listing stops once it passes the largest key, even if truncated."""
+        mock_s3.list_objects_v2.side_effect = [
+            {
+                "Contents": [{"Key": "raw-logs/job-1.log"}, {"Key": "raw-logs/job-4.log"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token-1",
+            },
+        ]
+        
+        found = find_existing_objects(["raw-logs/job-1.log", "raw-logs/job-3.log"])
+        
+        assert found == {"raw-logs/job-1.log"}
+        mock_s3.list_objects_v2.assert_called_once()
+    
+    def test_find_existing_objects_wide_range_falls_back_to_head(self, mock_s3):
+        """Test a key range spanning many unrelated objects stops listing early."""
+        pages = iter(range(100))
+        
+        def list_page(**kwargs):
+            page = next(pages)
+            keys = [f"raw-logs/{page:03d}-{i:04d}.log" for i in range(1000)]
+            if page == 0:
+                keys[0] = "raw-logs/000-0000-old.log"
+            return {
+                "Contents": [{"Key": key} for key in keys],
+                "IsTruncated": True,
+                "NextContinuationToken": f"token-{page + 1}",
+            }
+        
+        mock_s3.list_objects_v2.side_effect = list_page
+        
+        found = find_existing_objects(["raw-logs/000-0000-old.log", "raw-logs/999-new.log"])
+        
+        assert found == {"raw-logs/000-0000-old.log", "raw-logs/999-new.log"}
+        assert mock_s3.list_objects_v2.call_count == 2
+        mock_s3.head_object.assert_called_once_with(
+            Bucket=settings.S3_BUCKET, Key="raw-logs/999-new.log"
+        )
+    
+    def test_find_existing_objects_empty(self, mock_s3):
+        """Test finding existing objects with no keys does not call S3."""
+        assert find_existing_objects([]) == set()
+        mock_s3.list_objects_v2.assert_not_called()
+    
+    def test_find_existing_objects_error(self, mock_s3):
+        """Test finding existing objects with a listing error."""
+        mock_s3.list_objects_v2.side_effect = ClientError(
+            ACCESS_DENIED,
+            "ListObjectsV2",
+        )
+        
+        with pytest.raises(StorageError):
+            find_existing_objects(["test-key"])
+    
+    def test_get_object_size_success(self, mock_s3):
         """Test getting object size successfully."""
-        mock_s3_client.head_object.return_value = {"ContentLength": 1024}
+        mock_s3.head_object.return_value = {"ContentLength": 1024}
         
         size = get_object_size("test-key")
         
         assert size == 1024
     
-    @patch("app.storage.s3_client")
-    def test_get_object_size_not_found(self, mock_s3_client):
+    def test_get_object_size_not_found(self, mock_s3):
         """Test getting object size when object doesn't exist."""
-        error_response = {"Error": {"Code": "404", "Message": "Not Found"}}
-        mock_s3_client.head_object.side_effect = ClientError(
-            error_response,
+        mock_s3.head_object.side_effect = ClientError(
+            NOT_FOUND,
             "HeadObject",
         )
         
@@ -106,20 +184,18 @@ class TestStorage:
         
         assert size is None
     
-    @patch("app.storage.s3_client")
-    def test_check_storage_connection_success(self, mock_s3_client):
+    def test_check_storage_connection_success(self, mock_s3):
         """Test successful storage connection check."""
-        mock_s3_client.list_buckets.return_value = {"Buckets": []}
+        mock_s3.list_buckets.return_value = {"Buckets": []}
         
         result = check_storage_connection()
         
         assert result is True
-        mock_s3_client.list_buckets.assert_called_once()
+        mock_s3.list_buckets.assert_called_once()
     
-    @patch("app.storage.s3_client")
-    def test_check_storage_connection_failure(self, mock_s3_client):
+    def test_check_storage_connection_failure(self, mock_s3):
         """Test storage connection check failure."""
-        mock_s3_client.list_buckets.side_effect = Exception("Connection error")
+        mock_s3.list_buckets.side_effect = Exception("Connection error")
         
         result = check_storage_connection()
         